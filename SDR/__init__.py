@@ -1,4 +1,4 @@
-from .sdr_ingest import create_sdr_source, SDRIngest  # noqa: F401
+from .sdr_ingest import create_sdr_source, SDRIngest, AsyncSDRSource  # noqa: F401
 from .signal_processing import (  # noqa: F401
     compute_power,
     demodulate,
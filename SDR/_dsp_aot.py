@@ -0,0 +1,60 @@
+"""Ahead-of-time build of the DSP hot-path kernels.
+
+Run ``python -m SDR._dsp_aot`` once to produce the ``astrotrace_dsp`` extension
+next to this file. ``SDR.signal_processing`` and ``core.multi_demod`` pick it up and
+skip Numba JIT warm-up entirely; without it the JIT/NumPy paths are used.
+
+Signatures are strict (float32 / complex64); callers cast before dispatch.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("astrotrace_dsp")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+
+@cc.export("iir_f32", "f4[:](f4[:], f4)")
+def iir_f32(signal, alpha):
+    out = np.empty_like(signal)
+    acc = np.float32(0.0)
+    beta = np.float32(1.0) - alpha
+    for i in range(signal.shape[0]):
+        acc = alpha * acc + beta * signal[i]
+        out[i] = acc
+    return out
+
+
+@cc.export("power_c64", "f8(c8[:])")
+def power_c64(samples):
+    acc = 0.0
+    for i in range(samples.shape[0]):
+        v = samples[i]
+        acc += v.real * v.real + v.imag * v.imag
+    return np.sqrt(acc / max(samples.shape[0], 1))
+
+
+@cc.export("fm_disc", "f4[:](c8[:], f4)")
+def fm_disc(samples, scale):
+    n = max(samples.shape[0] - 1, 0)
+    out = np.empty(n, dtype=np.float32)
+    for i in range(n):
+        p = samples[i + 1] * np.conj(samples[i])
+        out[i] = np.float32(np.arctan2(p.imag, p.real)) * scale
+    return out
+
+
+@cc.export("mix_c64", "void(c8[:], c8[:, :], i8[:], c8[:], c8[:, :])")
+def mix_c64(samples, lo, rows, rot, out):
+    n = samples.shape[0]
+    for j in range(rows.shape[0]):
+        c = rows[j]
+        r = rot[c]
+        for i in range(n):
+            out[j, i] = samples[i] * lo[c, i] * r
+
+
+if __name__ == "__main__":
+    cc.compile()
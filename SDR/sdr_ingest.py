@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+import threading
 import numpy as np
 from abc import ABC, abstractmethod
 
-try:
-    from rtlsdr import RtlSdr
-    _rtl_import_error = None
-except Exception as e:
-    RtlSdr = None
-    _rtl_import_error = e
-try:
-    import SoapySDR
-    from SoapySDR import SOAPY_SDR_RX, SOAPY_SDR_CS16
-    _soapy_import_error = None
-except Exception as e:
-    SoapySDR = None
-    _soapy_import_error = e
+from .signal_processing import carrier, time_base
+
+
+def _packed_bytes_to_complex64(buf) -> np.ndarray:
+    """Convert interleaved unsigned 8-bit I/Q (RTL-SDR native) to complex64 in one pass.
+
+    Matches pyrtlsdr's ``packed_bytes_to_iq`` scaling but skips its complex128
+    intermediate.
+    """
+    if isinstance(buf, (bytes, bytearray)):
+        raw = np.frombuffer(buf, dtype=np.uint8)
+    else:
+        raw = np.ctypeslib.as_array(buf)
+    iq = raw.view(np.uint8).astype(np.float32)
+    iq -= 127.5
+    iq *= 1.0 / 127.5
+    return iq.view(np.complex64)
+
+
+def _cs16_to_complex64(raw: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Scale interleaved int16 I/Q to complex64 in [-1, 1) with one ufunc pass."""
+    if out is None:
+        out = np.empty(raw.size // 2, dtype=np.complex64)
+    np.multiply(raw, np.float32(1.0 / 32768.0), out=out.view(np.float32))
+    return out
 
 
 class BaseSDRSource(ABC):
@@ -28,6 +41,12 @@ class BaseSDRSource(ABC):
 
     @abstractmethod
     def read_samples(self, num_samples: int) -> np.ndarray:
+        """Return up to ``num_samples`` complex64 samples.
+
+        Each call returns a new array owned by the caller: consumers may keep it
+        past the next read or modify it in place, so a source must not hand out
+        a buffer it later refills.
+        """
         ...
 
     @abstractmethod
@@ -46,14 +65,16 @@ class BaseSDRSource(ABC):
 
 class RTLSDRSource(BaseSDRSource):
     def __init__(self, sample_rate: float, center_freq: float, gain: float | None):
-        if RtlSdr is None:
-            detail = f"{_rtl_import_error}" if _rtl_import_error else "unknown import error"
+        # Imported here so synthetic/file runs never pay for (or trip over) the backend.
+        try:
+            from rtlsdr import RtlSdr
+        except Exception as e:
             raise RuntimeError(
                 "RTL-SDR backend unavailable. "
-                f"Python module 'rtlsdr' failed to import ({detail}). "
+                f"Python module 'rtlsdr' failed to import ({e}). "
                 "Install 'pyrtlsdr' and ensure the system 'librtlsdr' is installed "
                 "(macOS: `brew install rtl-sdr`)."
-            )
+            ) from e
         super().__init__(sample_rate, center_freq, gain)
         try:
             self.device = RtlSdr()
@@ -69,8 +90,11 @@ class RTLSDRSource(BaseSDRSource):
         self.device.gain = "auto" if gain is None else gain
 
     def read_samples(self, num_samples: int) -> np.ndarray:
-        samples = self.device.read_samples(num_samples)
-        return np.array(samples, dtype=np.complex64)
+        read_bytes = getattr(self.device, "read_bytes", None)
+        if read_bytes is None:
+            samples = self.device.read_samples(num_samples)
+            return np.asarray(samples, dtype=np.complex64)
+        return _packed_bytes_to_complex64(read_bytes(2 * num_samples))
 
     def tune(self, freq_hz: float) -> None:
         self.center_freq = freq_hz
@@ -97,36 +121,70 @@ class RTLSDRSource(BaseSDRSource):
 
 class SoapySDRSource(BaseSDRSource):
     def __init__(self, sample_rate: float, center_freq: float, gain: float | None):
-        if SoapySDR is None:
-            detail = f"{_soapy_import_error}" if _soapy_import_error else "not installed"
+        try:
+            import SoapySDR
+        except Exception as e:
             raise RuntimeError(
                 "SoapySDR backend unavailable. "
-                f"{detail}. "
+                f"{e}. "
                 "On macOS, install via Homebrew: `brew install soapysdr`."
-            )
+            ) from e
         super().__init__(sample_rate, center_freq, gain)
+        self._soapy = SoapySDR
+        self._rx = SoapySDR.SOAPY_SDR_RX
         self.device = SoapySDR.Device(dict())
-        self.device.setSampleRate(SOAPY_SDR_RX, 0, sample_rate)
-        self.device.setFrequency(SOAPY_SDR_RX, 0, center_freq)
+        self.device.setSampleRate(self._rx, 0, sample_rate)
+        self.device.setFrequency(self._rx, 0, center_freq)
         if gain is not None:
             try:
-                self.device.setGain(SOAPY_SDR_RX, 0, gain)
+                self.device.setGain(self._rx, 0, gain)
             except Exception:
                 pass
-        self.rx_stream = self.device.setupStream(SOAPY_SDR_RX, SOAPY_SDR_CS16, [0])
+        # Prefer CF32 so the driver fills complex64 directly; fall back to CS16 + one scaling pass.
+        try:
+            formats = list(self.device.getStreamFormats(self._rx, 0))
+        except Exception:
+            formats = []
+        self.stream_format = SoapySDR.SOAPY_SDR_CF32 if SoapySDR.SOAPY_SDR_CF32 in formats else SoapySDR.SOAPY_SDR_CS16
+        # Ask for deeper driver-side buffering; drivers ignore args they don't know.
+        try:
+            self.rx_stream = self.device.setupStream(self._rx, self.stream_format, [0], {"buffers": "32"})
+        except Exception:
+            self.rx_stream = self.device.setupStream(self._rx, self.stream_format, [0])
+        try:
+            self._mtu = int(self.device.getStreamMTU(self.rx_stream)) or 8192
+        except Exception:
+            self._mtu = 8192
+        self._scratch = np.empty(2 * self._mtu, dtype=np.int16)
         self.device.activateStream(self.rx_stream)
 
+    @property
+    def block_size(self) -> int:
+        """Driver MTU in samples; reads of this size map to one transfer."""
+        return self._mtu
+
     def read_samples(self, num_samples: int) -> np.ndarray:
-        buff = np.empty(2 * num_samples, dtype=np.int16)
-        sr = self.device.readStream(self.rx_stream, [buff], num_samples)
-        if getattr(sr, "ret", 0) > 0:
-            iq = buff.astype(np.float32).view(np.complex64)
-            return iq[: sr.ret]
-        return np.array([], dtype=np.complex64)
+        # Read in MTU-sized pieces so the driver never has to split a transfer.
+        out = np.empty(num_samples, dtype=np.complex64)
+        cf32 = self.stream_format == self._soapy.SOAPY_SDR_CF32
+        filled = 0
+        while filled < num_samples:
+            n = min(self._mtu, num_samples - filled)
+            if cf32:
+                sr = self.device.readStream(self.rx_stream, [out[filled : filled + n]], n)
+            else:
+                sr = self.device.readStream(self.rx_stream, [self._scratch], n)
+            got = getattr(sr, "ret", 0)
+            if got <= 0:
+                break
+            if not cf32:
+                _cs16_to_complex64(self._scratch[: 2 * got], out[filled : filled + got])
+            filled += got
+        return out[:filled]
 
     def tune(self, freq_hz: float) -> None:
         self.center_freq = freq_hz
-        self.device.setFrequency(SOAPY_SDR_RX, 0, freq_hz)
+        self.device.setFrequency(self._rx, 0, freq_hz)
 
     def close(self) -> None:
         try:
@@ -141,6 +199,8 @@ class SoapySDRSource(BaseSDRSource):
             "sample_rate": self.sample_rate,
             "center_freq": self.center_freq,
             "gain": self.gain,
+            "stream_format": self.stream_format,
+            "mtu": self._mtu,
         }
         try:
             info["driver"] = self.device.getDriverKey()
@@ -154,7 +214,13 @@ class SoapySDRSource(BaseSDRSource):
 class FileSDRSource(BaseSDRSource):
     def __init__(self, sample_rate: float, center_freq: float, filename: str):
         self.filename = filename
-        self.file_data = np.load(filename)
+        # Map rather than load: pages fault in as the read pointer advances, so
+        # multi-GB captures start instantly and never sit fully in RAM.
+        if str(filename).endswith(".npy"):
+            self.file_data = np.load(filename, mmap_mode="r")
+        else:
+            # Raw interleaved cf32 (.iq, .cfile, .sigmf-data)
+            self.file_data = np.memmap(filename, dtype=np.complex64, mode="r")
         self.file_ptr = 0
         self.sample_count = len(self.file_data)
         super().__init__(sample_rate, center_freq, gain=None)
@@ -167,7 +233,7 @@ class FileSDRSource(BaseSDRSource):
         self.file_ptr = end_idx
         if self.file_ptr >= self.sample_count:
             self.file_ptr = 0
-        return np.array(samples, dtype=np.complex64)
+        return np.asarray(samples, dtype=np.complex64)
 
     def tune(self, freq_hz: float) -> None:
         self.center_freq = freq_hz
@@ -186,34 +252,53 @@ class FileSDRSource(BaseSDRSource):
 
 
 class SyntheticSDRSource(BaseSDRSource):
-    """Synthetic IQ source (no hardware) for UI demos and smoke tests."""
+    """Synthetic IQ source (no hardware) for UI demos and smoke tests.
 
-    def __init__(self, sample_rate: float, center_freq: float, gain: float | None = None):
+    Only the intermediates (tone, burst phase and mask) live in preallocated
+    buffers; each block is a new array, as ``BaseSDRSource.read_samples``
+    requires.
+    """
+
+    def __init__(self, sample_rate: float, center_freq: float, gain: float | None = None, block_hint: int = 4096):
         super().__init__(sample_rate=sample_rate, center_freq=center_freq, gain=gain)
         self._sample_index = 0
+        self._rng = np.random.default_rng()
+        self._alloc(block_hint)
+
+    def _alloc(self, num_samples: int) -> None:
+        self._block = int(num_samples)
+        self._scratch_tone = np.empty(self._block, dtype=np.complex64)
+        self._scratch_phase = np.empty(self._block, dtype=np.float64)
+        self._scratch_mask = np.empty(self._block, dtype=np.float32)
 
     def read_samples(self, num_samples: int) -> np.ndarray:
         sr = float(self.sample_rate)
         n0 = self._sample_index
-        t = (np.arange(num_samples, dtype=np.float32) + n0) / sr
+        if num_samples != self._block:
+            self._alloc(num_samples)
 
-        # Baseband noise
-        noise = 0.08 * (np.random.randn(num_samples) + 1j * np.random.randn(num_samples))
+        # Baseband noise: interleaved float32 normals written straight into the complex64 buffer.
+        iq = np.empty(num_samples, dtype=np.complex64)
+        self._rng.standard_normal(dtype=np.float32, out=iq.view(np.float32))
+        iq *= np.float32(0.08)
 
         # Burst a tone on/off so squelch/event logic can trigger and stop.
-        # Less frequent to avoid spamming bundles.
+        # Less frequent to avoid spamming bundles. Gated per sample so a burst
+        # edge lands mid-block instead of snapping to the block boundary.
         burst_period_s = 10.0
         burst_on_s = 3.0
-        phase = (n0 / sr) % burst_period_s
-        tone_on = phase < burst_on_s
-        if tone_on:
-            tone_hz = 25_000.0
-            tone = 1.0 * np.exp(1j * 2.0 * np.pi * tone_hz * t)
-        else:
-            tone = 0.0
+        tone_hz = 25_000.0
+        phase = np.add(time_base(num_samples, sr), n0 / sr, out=self._scratch_phase)
+        np.mod(phase, burst_period_s, out=phase)
+        on_mask = np.less(phase, burst_on_s, out=self._scratch_mask)
+        # Cached carrier rotated to this block's start keeps phase continuous.
+        rot = np.complex64(np.exp(1j * 2.0 * np.pi * tone_hz * n0 / sr))
+        tone = np.multiply(carrier(num_samples, sr, tone_hz), rot, out=self._scratch_tone)
+        tone *= on_mask
+        iq += tone
 
         self._sample_index += num_samples
-        return (noise + tone).astype(np.complex64)
+        return iq
 
     def tune(self, freq_hz: float) -> None:
         self.center_freq = freq_hz
@@ -230,19 +315,167 @@ class SyntheticSDRSource(BaseSDRSource):
         }
 
 
-def create_sdr_source(kind: str, sample_rate: float, center_freq: float, gain: float | None = None, filename: str | None = None) -> BaseSDRSource:
+class AsyncSDRSource(BaseSDRSource):
+    """Wrap a source with an acquire thread that fills a fixed-capacity IQ ring.
+
+    USB/driver waits then overlap with DSP in the consumer. When the consumer
+    falls behind, the oldest samples are overwritten and counted in
+    ``overflows`` rather than stalling the device.
+
+    A read that keeps failing after ``_READ_RETRIES`` attempts is re-raised
+    from ``read_samples`` once the ring is drained, and ``read_samples`` raises
+    ``TimeoutError`` if the device delivers nothing for ``timeout`` seconds; an
+    empty array means the inner source is exhausted (or the wrapper closed).
+    """
+
+    _READ_RETRIES = 3
+
+    def __init__(self, inner: BaseSDRSource, block_size: int | None = None, ring_blocks: int = 32, timeout: float = 5.0):
+        super().__init__(inner.sample_rate, inner.center_freq, inner.gain)
+        self._inner = inner
+        self.block_size = int(block_size or _stream_mtu(inner) or 4096)
+        self.timeout = timeout
+        self.overflows = 0
+        self._ring = np.zeros(self.block_size * max(int(ring_blocks), 2), dtype=np.complex64)
+        self._written = 0  # total samples produced
+        self._consumed = 0  # total samples handed to the consumer
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._exhausted = False
+        self._error: Exception | None = None
+        # Bumped by tune(); blocks read under an older generation are dropped.
+        self._tune_gen = 0
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def _pump(self) -> None:
+        cap = self._ring.size
+        failures = 0
+        while not self._stop.is_set():
+            with self._io_lock:
+                gen = self._tune_gen
+                try:
+                    block = self._inner.read_samples(self.block_size)
+                except Exception as exc:
+                    block = None
+                    error = exc
+            if block is None:
+                failures += 1
+                if failures < self._READ_RETRIES:
+                    self._stop.wait(0.05 * failures)
+                    continue
+                with self._cond:
+                    self._error = error
+                    self._exhausted = True
+                    self._cond.notify_all()
+                return
+            failures = 0
+            with self._cond:
+                if gen != self._tune_gen:
+                    # Read started before a retune: old-frequency samples.
+                    continue
+                if block.size == 0:
+                    self._exhausted = True
+                    self._cond.notify_all()
+                    return
+                n = min(block.size, cap)
+                block = block[-n:]
+                start = self._written % cap
+                first = min(n, cap - start)
+                self._ring[start : start + first] = block[:first]
+                if first < n:
+                    self._ring[: n - first] = block[first:]
+                self._written += n
+                if self._written - self._consumed > cap:
+                    self.overflows += 1
+                    self._consumed = self._written - cap
+                self._cond.notify_all()
+
+    def read_samples(self, num_samples: int) -> np.ndarray:
+        cap = self._ring.size
+        num_samples = min(int(num_samples), cap)
+        with self._cond:
+            ready = self._cond.wait_for(
+                lambda: self._written - self._consumed >= num_samples or self._exhausted or self._stop.is_set(),
+                timeout=self.timeout,
+            )
+            if not ready:
+                raise TimeoutError(f"No IQ samples from the SDR for {self.timeout:.1f} s")
+            n = min(num_samples, self._written - self._consumed)
+            if n == 0 and self._error is not None:
+                raise self._error
+            out = np.empty(n, dtype=np.complex64)
+            start = self._consumed % cap
+            first = min(n, cap - start)
+            out[:first] = self._ring[start : start + first]
+            if first < n:
+                out[first:] = self._ring[: n - first]
+            self._consumed += n
+        return out
+
+    def tune(self, freq_hz: float) -> None:
+        self.center_freq = freq_hz
+        with self._io_lock:
+            self._inner.tune(freq_hz)
+            # Drop samples captured at the previous frequency, including a block
+            # the pump finished reading but has not yet stored.
+            with self._cond:
+                self._tune_gen += 1
+                self._consumed = self._written
+
+    def close(self) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        self._thread.join(timeout=self.timeout + 1.0)
+        with self._io_lock:
+            self._inner.close()
+
+    def get_info(self) -> dict:
+        info = dict(self._inner.get_info())
+        info["async_block_size"] = self.block_size
+        info["overflows"] = self.overflows
+        return info
+
+
+def _stream_mtu(source: BaseSDRSource) -> int | None:
+    """Return the driver's preferred transfer size in samples, if it reports one."""
+    mtu = getattr(source, "block_size", None)
+    if mtu:
+        return int(mtu)
+    device = getattr(source, "device", None)
+    stream = getattr(source, "rx_stream", None)
+    if device is None or stream is None or not hasattr(device, "getStreamMTU"):
+        return None
+    try:
+        return int(device.getStreamMTU(stream)) or None
+    except Exception:
+        return None
+
+
+def create_sdr_source(
+    kind: str,
+    sample_rate: float,
+    center_freq: float,
+    gain: float | None = None,
+    filename: str | None = None,
+    async_: bool = False,
+) -> BaseSDRSource:
     kind = (kind or "rtl").lower()
     if kind == "synthetic":
-        return SyntheticSDRSource(sample_rate=sample_rate, center_freq=center_freq, gain=gain)
-    if kind == "rtl":
-        return RTLSDRSource(sample_rate=sample_rate, center_freq=center_freq, gain=gain)
-    if kind == "soapy":
-        return SoapySDRSource(sample_rate=sample_rate, center_freq=center_freq, gain=gain)
-    if kind == "file":
+        source = SyntheticSDRSource(sample_rate=sample_rate, center_freq=center_freq, gain=gain)
+    elif kind == "rtl":
+        source = RTLSDRSource(sample_rate=sample_rate, center_freq=center_freq, gain=gain)
+    elif kind == "soapy":
+        source = SoapySDRSource(sample_rate=sample_rate, center_freq=center_freq, gain=gain)
+    elif kind == "file":
         if not filename:
             raise ValueError("filename must be provided for file source")
-        return FileSDRSource(sample_rate=sample_rate, center_freq=center_freq, filename=filename)
-    raise ValueError(f"Unknown source type: {kind}")
+        source = FileSDRSource(sample_rate=sample_rate, center_freq=center_freq, filename=filename)
+    else:
+        raise ValueError(f"Unknown source type: {kind}")
+    return AsyncSDRSource(source) if async_ else source
 
 
 class SDRIngest(BaseSDRSource):
@@ -6,36 +6,131 @@ dedicated demodulators with proper filtering, de-emphasis, and AGC).
 """
 
 import numpy as np
-from typing import Optional
+from functools import lru_cache
+from math import gcd, sqrt
+from typing import Optional, Tuple
+
+try:
+    # Prebuilt by `python -m SDR._dsp_aot`; no JIT warm-up when present.
+    from .astrotrace_dsp import iir_f32, power_c64, fm_disc
+except ImportError:
+    iir_f32 = power_c64 = fm_disc = None
+
+
+@lru_cache(maxsize=1)
+def _scipy_signal():
+    """``scipy.signal`` imported on first use, or None; it is slow to import."""
+    try:
+        import scipy.signal
+    except ImportError:
+        return None
+    return scipy.signal
+
+
+@lru_cache(maxsize=8)
+def time_base(num_samples: int, sample_rate: float, dtype=np.float64) -> np.ndarray:
+    """Return a cached, read-only ``arange(num_samples) / sample_rate`` vector."""
+    t = (np.arange(num_samples, dtype=np.float64) / float(sample_rate)).astype(dtype, copy=False)
+    t.flags.writeable = False
+    return t
+
+
+@lru_cache(maxsize=16)
+def carrier(num_samples: int, sample_rate: float, freq_hz: float) -> np.ndarray:
+    """Return a cached, read-only complex64 ``exp(j*2*pi*freq_hz*t)`` starting at t=0.
+
+    Callers needing phase continuity across blocks multiply by a scalar
+    ``exp(j*2*pi*freq_hz*n0/sample_rate)`` instead of rebuilding the table.
+    """
+    c = np.exp(1j * 2.0 * np.pi * freq_hz * time_base(num_samples, sample_rate)).astype(np.complex64)
+    c.flags.writeable = False
+    return c
 
 
 def compute_power(samples: np.ndarray) -> float:
     """Compute RMS magnitude."""
     if samples.size == 0:
         return 0.0
-    return float(np.sqrt(np.mean(np.abs(samples) ** 2)))
+    if power_c64 is not None and samples.dtype == np.complex64 and samples.ndim == 1:
+        return float(power_c64(samples))
+    # vdot conjugates its first argument, so this is sum(|x|^2) in one BLAS pass.
+    s = np.ascontiguousarray(samples)
+    return float(np.sqrt(np.vdot(s, s).real / s.size))
+
+
+@lru_cache(maxsize=16)
+def _poly_factors(src_rate: float, target_rate: float) -> Optional[Tuple[int, int]]:
+    """Return (up, down) for an exact integer rate ratio, or None if impractical."""
+    if float(src_rate).is_integer() and float(target_rate).is_integer():
+        g = gcd(int(target_rate), int(src_rate))
+        up, down = int(target_rate) // g, int(src_rate) // g
+        if max(up, down) <= 1000:
+            return up, down
+    return None
 
 
 def _resample(audio: np.ndarray, src_rate: float, target_rate: float) -> np.ndarray:
     if src_rate == target_rate or audio.size == 0:
-        return audio.astype(np.float32)
+        return audio.astype(np.float32, copy=False)
+    sps = _scipy_signal()
+    factors = _poly_factors(src_rate, target_rate) if sps is not None else None
+    if factors is not None:
+        # Polyphase FIR: anti-aliased and only computes the kept output samples.
+        up, down = factors
+        return sps.resample_poly(audio, up, down, window=("kaiser", 5.0)).astype(np.float32, copy=False)
     ratio = target_rate / float(src_rate)
     new_length = int(np.ceil(audio.size * ratio))
     return np.interp(
         np.linspace(0, audio.size, new_length, endpoint=False),
         np.arange(audio.size),
         audio,
-    ).astype(np.float32)
+    ).astype(np.float32, copy=False)
+
+
+def _iir_loop(signal: np.ndarray, alpha: np.float32, out: np.ndarray) -> None:
+    acc = np.float32(0.0)
+    beta = np.float32(1.0) - alpha
+    for i in range(signal.shape[0]):
+        acc = alpha * acc + beta * signal[i]
+        out[i] = acc
+
+
+@lru_cache(maxsize=1)
+def _get_iir_kernel():
+    """Numba build of ``_iir_loop``, compiled on first use; None without Numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    kernel = njit(cache=True, fastmath=True)(_iir_loop)
+    try:
+        kernel(np.zeros(1, dtype=np.float32), np.float32(0.5), np.empty(1, dtype=np.float32))
+    except Exception:
+        return None
+    return kernel
 
 
 def _single_pole_iir(signal: np.ndarray, alpha: float) -> np.ndarray:
     if signal.size == 0:
         return signal
-    out = np.empty_like(signal, dtype=np.float32)
-    acc = 0.0
-    for i, s in enumerate(signal):
-        acc = alpha * acc + (1 - alpha) * s
-        out[i] = acc
+    signal = np.ascontiguousarray(signal, dtype=np.float32)
+    # Keep alpha float32 so Numba dispatches to a single compiled specialization.
+    alpha = np.float32(alpha)
+    if iir_f32 is not None:
+        return iir_f32(signal, alpha)
+    kernel = _get_iir_kernel()
+    if kernel is not None:
+        out = np.empty_like(signal)
+        kernel(signal, alpha, out)
+        return out
+    sps = _scipy_signal()
+    if sps is not None:
+        # Same one-pole recurrence, y[n] = alpha*y[n-1] + (1-alpha)*x[n], in SciPy's C loop.
+        b = np.array([1.0 - alpha], dtype=np.float32)
+        a = np.array([1.0, -alpha], dtype=np.float32)
+        return sps.lfilter(b, a, signal).astype(np.float32, copy=False)
+    out = np.empty_like(signal)
+    _iir_loop(signal, alpha, out)
     return out
 
 
@@ -51,8 +146,11 @@ def _deemphasis(audio: np.ndarray, sample_rate: float, tau: float = 75e-6) -> np
 def _simple_agc(audio: np.ndarray, target_rms: float = 0.1, eps: float = 1e-6) -> np.ndarray:
     if audio.size == 0:
         return audio
-    rms = np.sqrt(np.mean(audio**2)) + eps
-    return (audio * (target_rms / rms)).astype(np.float32)
+    # Callers pass freshly demodulated buffers, so scaling in place is safe.
+    a = np.ascontiguousarray(audio, dtype=np.float32)
+    rms = sqrt(float(np.dot(a, a)) / a.size) + eps
+    np.multiply(a, np.float32(target_rms / rms), out=a)
+    return a
 
 
 class BaseDemodulator:
@@ -67,9 +165,15 @@ class FMDemodulator(BaseDemodulator):
     def demod(self, samples: np.ndarray, sample_rate: float) -> np.ndarray:
         if samples.size == 0:
             return np.array([], dtype=np.float32)
-        phase = np.unwrap(np.angle(samples))
-        inst_freq = np.diff(phase) * sample_rate / (2 * np.pi)
-        inst_freq = inst_freq - np.mean(inst_freq)
+        # Polar discriminator: arg(s[n] * conj(s[n-1])) is already wrapped to (-pi, pi],
+        # so no unwrap/diff pass is needed.
+        scale = np.float32(sample_rate / (2 * np.pi))
+        if fm_disc is not None:
+            inst_freq = fm_disc(np.ascontiguousarray(samples, dtype=np.complex64), scale)
+        else:
+            prod = samples[1:] * np.conj(samples[:-1])
+            inst_freq = np.angle(prod).astype(np.float32) * scale
+        inst_freq -= np.float32(inst_freq.sum() / inst_freq.size)
         deemph = _deemphasis(inst_freq, sample_rate)
         audio = _resample(deemph, sample_rate, self.audio_rate)
         return _simple_agc(audio)
@@ -87,7 +191,9 @@ class AMDemodulator(BaseDemodulator):
 
 class PassthroughDemodulator(BaseDemodulator):
     def demod(self, samples: np.ndarray, sample_rate: float) -> np.ndarray:
-        return _resample(np.real(samples), sample_rate, self.audio_rate)
+        # No copy for contiguous real float32 input: sources hand out blocks the caller owns.
+        audio = np.ascontiguousarray(np.real(samples), dtype=np.float32)
+        return _resample(audio, sample_rate, self.audio_rate)
 
 
 class DemodulatorFactory:
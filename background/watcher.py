@@ -1,29 +1,165 @@
 import os
 import time
+import queue
 import threading
 from core.transcriber import Transcriber
 from core.logger import EventLogger
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+
+class _WavEventHandler(FileSystemEventHandler):
+    """Forward .wav paths that were created, modified, moved or deleted to the watcher queue.
+
+    The watcher stats each path; one that no longer exists is dropped from ``seen_files``.
+    """
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def _put(self, path):
+        if str(path).endswith(".wav"):
+            self.events.put(str(path))
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._put(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._put(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._put(event.src_path)
+            self._put(event.dest_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._put(event.src_path)
+
+
 class FileWatcher(threading.Thread):
-def __init__(self, watch_dir, interval=5):
-super().__init__()
-self.watch_dir = watch_dir
-self.interval = interval
-self.running = True
-self.seen_files = set()
-self.transcriber = Transcriber()
-self.logger = EventLogger()
-
-def run(self):
-while self.running:
-for fname in os.listdir(self.watch_dir):
-if fname.endswith(".wav") and fname not in self.seen_files:
-filepath = os.path.join(self.watch_dir, fname)
-print(f"[Watcher] Processing new file: {filepath}")
-text = self.transcriber.transcribe_file(filepath)
-self.logger.log_event(freq=0.0, text=text, source='watcher')
-self.seen_files.add(fname)
-time.sleep(self.interval)
-
-def stop(self):
-self.running = False
\ No newline at end of file
+    def __init__(self, watch_dir, interval=5, settle=2.0):
+        super().__init__()
+        self.watch_dir = watch_dir
+        self.interval = interval
+        # A file is processed only after its (mtime, size) held for this long,
+        # so a recording still being written is transcribed once, when complete.
+        self.settle = settle
+        self.running = True
+        # name -> (mtime_ns, size) of processed files; a changed file is picked up again.
+        self.seen_files = {}
+        # name -> (path, (mtime_ns, size), monotonic time that signature was first seen)
+        self._pending = {}
+        self.transcriber = Transcriber()
+        self.logger = EventLogger()
+        self._events = queue.Queue()
+        self._observer = None
+
+    def _scan(self):
+        """Return (entry, stat) for new or modified .wav files, oldest first."""
+        with os.scandir(self.watch_dir) as it:
+            entries = [(e, e.stat()) for e in it if e.name.endswith(".wav") and e.is_file()]
+        # Forget files that were removed so the map is bounded by the directory size.
+        present = {e.name for e, _ in entries}
+        for name in list(self.seen_files):
+            if name not in present:
+                del self.seen_files[name]
+        fresh = [(e, st) for e, st in entries if self.seen_files.get(e.name) != (st.st_mtime_ns, st.st_size)]
+        fresh.sort(key=lambda item: item[1].st_mtime_ns)
+        return fresh
+
+    def _note(self, path, st):
+        """Queue a new or changed file; it is processed once it stops changing."""
+        name = os.path.basename(path)
+        sig = (st.st_mtime_ns, st.st_size)
+        if self.seen_files.get(name) == sig:
+            return
+        prev = self._pending.get(name)
+        if prev is None or prev[1] != sig:
+            self._pending[name] = (path, sig, time.monotonic())
+
+    def _process_settled(self):
+        now = time.monotonic()
+        for name, (path, sig, since) in list(self._pending.items()):
+            if now - since < self.settle:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self._pending[name]
+                continue
+            if (st.st_mtime_ns, st.st_size) != sig:
+                self._pending[name] = (path, (st.st_mtime_ns, st.st_size), now)
+                continue
+            del self._pending[name]
+            self._process(path, st)
+
+    def _process(self, path, st):
+        name = os.path.basename(path)
+        if self.seen_files.get(name) == (st.st_mtime_ns, st.st_size):
+            return
+        print(f"[Watcher] Processing new file: {path}")
+        text = self.transcriber.transcribe_file(path)
+        self.logger.log_event(0.0, text, metadata={"source": "watcher"})
+        self.seen_files[name] = (st.st_mtime_ns, st.st_size)
+
+    def _start_observer(self):
+        """Start kernel-notified watching (inotify/FSEvents/...); False if unsupported."""
+        if Observer is None:
+            return False
+        try:
+            observer = Observer()
+            observer.schedule(_WavEventHandler(self._events), self.watch_dir, recursive=False)
+            observer.start()
+        except Exception:
+            # e.g. network filesystems without change notification
+            return False
+        self._observer = observer
+        return True
+
+    def run(self):
+        if not self._start_observer():
+            self._run_polling()
+            return
+        # Pick up files that were already there before the observer started.
+        for entry, st in self._scan():
+            self._note(entry.path, st)
+        while self.running:
+            try:
+                path = self._events.get(timeout=min(self.interval, self.settle) if self._pending else self.interval)
+            except queue.Empty:
+                path = ""
+            if path is None:
+                break
+            if path:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    # Deleted or moved away: forget it so seen_files stays bounded.
+                    name = os.path.basename(path)
+                    self.seen_files.pop(name, None)
+                    self._pending.pop(name, None)
+                else:
+                    self._note(path, st)
+            self._process_settled()
+        self._observer.stop()
+        self._observer.join(timeout=1.0)
+
+    def _run_polling(self):
+        while self.running:
+            for entry, st in self._scan():
+                self._note(entry.path, st)
+            self._process_settled()
+            time.sleep(self.interval)
+
+    def stop(self):
+        self.running = False
+        self._events.put(None)
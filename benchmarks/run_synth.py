@@ -13,7 +13,7 @@ from core.logger import EventLogger
 from core import bundles
 
 
-def run_once(kind: str, threshold: float, bundle_root: str) -> bool:
+def run_once(kind: str, threshold: float, bundle_root: str, logger: EventLogger) -> bool:
     case = generate_case(kind)
     iq = case["iq"]
     sample_rate = case["sample_rate"]
@@ -25,7 +25,6 @@ def run_once(kind: str, threshold: float, bundle_root: str) -> bool:
         return False
 
     audio = demodulate(iq, mode="FM", sample_rate=sample_rate, audio_rate=16_000)
-    logger = EventLogger()
     event = logger.log_event(center_freq, f"synthetic:{kind}")
     bundles.write_event_bundle(
         event=event,
@@ -35,8 +34,9 @@ def run_once(kind: str, threshold: float, bundle_root: str) -> bool:
         mode="FM",
         bundle_root=bundle_root,
         save_sigmf=True,
+        # DSP above ran on complex64; storage only needs 8-bit I/Q like native RTL captures.
+        sigmf_datatype="ci8",
     )
-    logger.close()
     print(f"[{kind}] logged and bundled. power={power:.4f}, audio_len={len(audio)}")
     return True
 
@@ -49,9 +49,12 @@ def main():
     args = parser.parse_args()
 
     Path(args.bundle_root).mkdir(parents=True, exist_ok=True)
-    results = []
-    for kind in args.kinds:
-        results.append(run_once(kind, args.threshold, args.bundle_root))
+    # One logger for the whole run: log files are opened/closed once, not per case.
+    logger = EventLogger()
+    try:
+        results = [run_once(kind, args.threshold, args.bundle_root, logger) for kind in args.kinds]
+    finally:
+        logger.close()
     ok = all(results)
     print("All synthetic cases passed." if ok else "Some synthetic cases fell below threshold.")
 
@@ -1,6 +1,13 @@
 from .scanner import ScannerThread  # noqa: F401
-from .transcriber import Transcriber  # noqa: F401
 from .logger import EventLogger  # noqa: F401
 from .vector_store import TranscriptIndex  # noqa: F401
 from .agent import RadioOpsAgent, RadioController  # noqa: F401
 
+
+def __getattr__(name):
+    # Transcriber pulls in Whisper/torch; load it only when asked for.
+    if name == "Transcriber":
+        from .transcriber import Transcriber
+
+        return Transcriber
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
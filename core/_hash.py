@@ -0,0 +1,52 @@
+"""File hashing and JSON artifact writing shared by the bundle and SigMF writers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import sys
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def sha256_file(path: Path) -> str:
+    """Hex SHA-256 of a file, fed to OpenSSL in large blocks."""
+    with Path(path).open("rb") as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        size = f.seek(0, 2)
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        return h.hexdigest()
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Indented JSON for human-facing artifacts; orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def json_loads(raw: bytes | str) -> Any:
+    """Parse JSON with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_hashed(path: Path, obj: Any) -> str:
+    """Write ``obj`` as JSON and return the SHA-256 of the bytes written (no re-read)."""
+    payload = json_bytes(obj)
+    Path(path).write_bytes(payload)
+    return hashlib.sha256(payload).hexdigest()
@@ -6,6 +6,15 @@ from typing import Callable, List, Optional, Dict, Any
 
 from .vector_store import TranscriptIndex
 
+_EVENT_LINE = "{time} {freq_mhz:.3f} MHz: {text}"
+
+
+def _format_events(events: List[Dict[str, Any]]) -> str:
+    return "\n".join(
+        _EVENT_LINE.format(time=e.get("time", ""), freq_mhz=e.get("freq", 0) / 1e6, text=e.get("text", ""))
+        for e in events
+    )
+
 
 class RadioController:
     """Thin abstraction the agent uses to trigger UI actions safely."""
@@ -47,8 +56,8 @@ class RadioOpsAgent:
         self.controller = controller
         self.transcript_index = transcript_index
         self._agent = None
-        self._llm_available = False
-        self._build_agent()
+        # None = not probed yet; LangChain is imported on the first handle() call.
+        self._llm_available: Optional[bool] = None
 
     def _build_agent(self):
         try:
@@ -132,18 +141,18 @@ class RadioOpsAgent:
         events = self.controller.get_logs(n)
         if not events:
             return "No recent logs."
-        lines = [f"{e.get('time')} {e.get('freq',0)/1e6:.3f} MHz: {e.get('text','')}" for e in events]
-        return "\n".join(lines)
+        return _format_events(events)
 
     def _tool_search(self, text: str) -> str:
         results = self.controller.search(text.strip(), k=5)
         if not results:
             return "No matches."
-        lines = [f"{r.get('time','')} {r.get('freq',0)/1e6:.3f} MHz: {r.get('text','')}" for r in results]
-        return "\n".join(lines)
+        return _format_events(results)
 
     def handle(self, message: str) -> str:
         """Process a user message and return agent reply."""
+        if self._llm_available is None:
+            self._build_agent()
         if self._llm_available and self._agent:
             try:
                 return self._agent.run(message)
@@ -156,6 +165,5 @@ class RadioOpsAgent:
         if "tune" in msg or "set" in msg:
             return "Agent not configured with LLM. Please tune via UI."
         if "log" in msg:
-            events = self.controller.get_logs(5)
-            return "\n".join([f"{e.get('time')} {e.get('freq',0)/1e6:.3f} MHz: {e.get('text','')}" for e in events])
+            return _format_events(self.controller.get_logs(5))
         return "Agent offline (no LLM configured)."
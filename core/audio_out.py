@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 import numpy as np
-from queue import Queue, Empty
 from threading import Thread, Event
-import time
 
 
 class AudioOutput:
-    """Queue-based audio player using sounddevice if available, else PyAudio."""
+    """Ring-buffered audio player using sounddevice if available, else PyAudio.
 
-    def __init__(self, sample_rate: int = 16_000, blocksize: int = 1024):
+    ``push`` (one producer) clips straight into a preallocated float32 ring and
+    the output side (one consumer) copies out of it, so neither side allocates
+    or takes a lock per block. Only the producer moves ``_head`` and only the
+    consumer moves ``_tail``.
+    """
+
+    def __init__(self, sample_rate: int = 16_000, blocksize: int = 1024, ring_blocks: int = 100):
         self.sample_rate = sample_rate
         self.blocksize = blocksize
-        self._queue: Queue[np.ndarray] = Queue(maxsize=100)
+        self._ring = np.zeros(blocksize * max(int(ring_blocks), 2), dtype=np.float32)
+        self._head = 0  # total samples written
+        self._tail = 0  # total samples played
         self._stop = Event()
         self._thread: Thread | None = None
         self._backend = None
@@ -46,13 +52,21 @@ class AudioOutput:
 
     def stop(self):
         self._stop.set()
+        stream = self._stream
+        if self._backend and self._backend[0] == "sounddevice" and stream is not None:
+            try:
+                # Unblocks a pending write() so the player thread can see _stop.
+                stream.abort()
+            except Exception:
+                pass
         if self._thread:
             self._thread.join(timeout=1.0)
         self._thread = None
-        if self._backend and self._backend[0] == "pyaudio" and self._stream:
+        if stream is not None:
             try:
-                self._stream.stop_stream()
-                self._stream.close()
+                if self._backend[0] == "pyaudio":
+                    stream.stop_stream()
+                stream.close()
             except Exception:
                 pass
         self._stream = None
@@ -62,14 +76,31 @@ class AudioOutput:
             return
         if audio is None or audio.size == 0:
             return
-        # Ensure float32 and clamp
-        audio = np.asarray(audio, dtype=np.float32)
-        audio = np.clip(audio, -1.0, 1.0)
-        try:
-            self._queue.put_nowait(audio.copy())
-        except Exception:
-            # Drop if queue is full
-            pass
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        n = audio.size
+        cap = self._ring.size
+        if n > cap - (self._head - self._tail):
+            # Drop if the ring is full
+            return
+        # Clamp straight into the ring, in at most two segments around the wrap.
+        start = self._head % cap
+        first = min(n, cap - start)
+        np.clip(audio[:first], -1.0, 1.0, out=self._ring[start : start + first])
+        if n > first:
+            np.clip(audio[first:], -1.0, 1.0, out=self._ring[: n - first])
+        self._head += n
+
+    def _read_into(self, out: np.ndarray) -> int:
+        """Fill ``out`` from the ring, zero-padding any shortfall. Returns samples taken."""
+        cap = self._ring.size
+        m = min(self._head - self._tail, out.shape[0])
+        start = self._tail % cap
+        first = min(m, cap - start)
+        out[:first] = self._ring[start : start + first]
+        out[first:m] = self._ring[: m - first]
+        out[m:] = 0.0
+        self._tail += m
+        return m
 
     def _run(self):
         if not self.available:
@@ -77,41 +108,41 @@ class AudioOutput:
         if self._backend[0] == "sounddevice":
             sd = self._backend[1]
 
-            def callback(outdata, frames, time_info, status):  # type: ignore
-                try:
-                    chunk = self._queue.get_nowait()
-                except Empty:
-                    chunk = np.zeros(frames, dtype=np.float32)
-                if chunk.size < frames:
-                    pad = np.zeros(frames - chunk.size, dtype=np.float32)
-                    chunk = np.concatenate([chunk, pad])
-                outdata[:] = chunk.reshape(-1, 1)[:frames]
-
-            with sd.OutputStream(
+            # Blocking write mode: no Python callback on PortAudio's realtime thread.
+            self._stream = sd.OutputStream(
                 samplerate=self.sample_rate,
                 channels=1,
                 blocksize=self.blocksize,
                 dtype="float32",
-                callback=callback,
-            ):
-                while not self._stop.is_set():
-                    time.sleep(0.05)
+                latency="high",
+            )
+            self._stream.start()
+            block = np.zeros((self.blocksize, 1), dtype=np.float32)
+            while not self._stop.is_set():
+                self._read_into(block[:, 0])
+                try:
+                    self._stream.write(block)
+                except Exception:
+                    # Stream aborted by stop().
+                    break
             return
 
         if self._backend[0] == "pyaudio":
+            import pyaudio  # type: ignore
+
             pa = self._backend[1]
+            # Native float32 matches the ring's dtype, so the bytes written need no conversion.
             self._stream = pa.open(
-                format=pa.get_format_from_width(2),
+                format=pyaudio.paFloat32,
                 channels=1,
                 rate=int(self.sample_rate),
                 output=True,
                 frames_per_buffer=self.blocksize,
             )
+            chunk = np.zeros(self.blocksize, dtype=np.float32)
             while not self._stop.is_set():
-                try:
-                    chunk = self._queue.get(timeout=0.1)
-                except Empty:
-                    continue
+                # write() blocks at the device rate, so padding with silence paces this loop.
+                self._read_into(chunk)
                 self._stream.write(chunk.tobytes())
 
     def __del__(self):
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import json
-import hashlib
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
@@ -11,14 +9,7 @@ from datetime import datetime, timezone
 import numpy as np
 
 from . import sigmf
-
-
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+from ._hash import write_json_hashed
 
 
 def write_event_bundle(
@@ -29,13 +20,15 @@ def write_event_bundle(
     mode: str,
     bundle_root: str | Path = "runs",
     save_sigmf: bool = True,
+    sigmf_datatype: str = "cf32_le",
 ) -> Path:
     """Create a self-contained bundle for an event.
 
     Contents:
       - event.json (metadata from EventLogger)
       - manifest.json (paths + hashes)
-      - SigMF data/meta if IQ provided
+      - SigMF data/meta if IQ provided (``sigmf_datatype="ci8"`` stores
+        8-bit I/Q, a quarter of the cf32 size)
     """
     ts = event.get("time") or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H%M%SZ")
     freq_mhz = center_freq / 1e6
@@ -44,11 +37,10 @@ def write_event_bundle(
     bundle_dir.mkdir(parents=True, exist_ok=True)
 
     event_path = bundle_dir / "event.json"
-    with event_path.open("w", encoding="utf-8") as f:
-        json.dump(event, f, indent=2)
+    event_sha = write_json_hashed(event_path, event)
 
     manifest = {
-        "event": {"path": str(event_path), "sha256": _sha256_file(event_path)},
+        "event": {"path": str(event_path), "sha256": event_sha},
         "meta": {
             "sample_rate_hz": sample_rate,
             "center_freq_hz": center_freq,
@@ -64,13 +56,13 @@ def write_event_bundle(
             center_freq=center_freq,
             base_path=bundle_dir / "capture",
             extra={"core:mode": mode},
+            datatype=sigmf_datatype,
         )
         manifest["artifacts"].append(sig_paths["sigmf_data"])
         manifest["artifacts"].append(sig_paths["sigmf_meta"])
 
     manifest_path = bundle_dir / "manifest.json"
-    with manifest_path.open("w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    write_json_hashed(manifest_path, manifest)
 
     return bundle_dir
 
@@ -1,7 +1,9 @@
 import numpy as np
 
+
 def detect_anomalies(signal_data, threshold=2.5):
-std = np.std(signal_data)
-mean = np.mean(signal_data)
-anomalies = np.where(np.abs(signal_data - mean) > threshold * std)[0]
-return anomalies
\ No newline at end of file
+    """Indices where |x - mean| exceeds threshold * std."""
+    d = np.asarray(signal_data, dtype=np.float64) - np.mean(signal_data)
+    # Compare squared deviations against threshold^2 * variance: no abs, no sqrt.
+    np.multiply(d, d, out=d)
+    return np.flatnonzero(d > (threshold * threshold) * d.mean())
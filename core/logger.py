@@ -1,42 +1,91 @@
+import atexit
 import csv
 import datetime
 import json
 import logging
+import os
 import threading
+import weakref
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .vector_store import TranscriptIndex
 
+_WRITE_BUFFER = 64 * 1024
+
+# Open loggers, closed by one exit hook; a discarded logger drops out on its own.
+_live_loggers: "weakref.WeakSet[EventLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_loggers() -> None:
+    for logger in list(_live_loggers):
+        try:
+            logger.close()
+        except Exception:
+            pass
+
+
+def _jsonl_line(event: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return (json.dumps(event) + "\n").encode("utf-8")
+
 
 class EventLogger:
     """
     Logs events (signal detections, transcriptions, etc.) to disk and keeps a
     process-wide recent buffer. Optionally mirrors transcripts into a
     vector store for semantic search.
+
+    Writes are buffered; files are flushed (and fsynced) at most every
+    ``flush_interval`` seconds and on ``close()``. Transcripts reach the index
+    in batches of ``index_batch`` or at the next flush, whichever comes first.
     """
 
     _global_events: List[Dict[str, Any]] = []
     _lock = threading.Lock()
 
-    def __init__(self, log_file: str = "sdr_events.log", jsonl_file: str = "sdr_events.jsonl", transcript_index: Optional[TranscriptIndex] = None):
+    def __init__(
+        self,
+        log_file: str = "sdr_events.log",
+        jsonl_file: str = "sdr_events.jsonl",
+        transcript_index: Optional[TranscriptIndex] = None,
+        flush_interval: float = 0.5,
+        index_batch: int = 16,
+    ):
         self.log_file = log_file
         self.jsonl_file = jsonl_file
         self.transcript_index = transcript_index
+        self.flush_interval = flush_interval
+        self.index_batch = index_batch
+        self._pending_index: List[tuple] = []
         self.events: List[Dict[str, Any]] = []
+        self._io_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
         self._csv = None
+        self._csv_writer = None
         try:
-            self._csv = open(self.log_file, "a", newline="")
+            self._csv = open(self.log_file, "a", newline="", buffering=_WRITE_BUFFER)
+            self._csv_writer = csv.writer(self._csv)
             if self._csv.tell() == 0:
-                writer = csv.writer(self._csv)
-                writer.writerow(["Time", "Frequency_MHz", "Transcribed_Text"])
+                self._csv_writer.writerow(["Time", "Frequency_MHz", "Transcribed_Text"])
         except Exception as exc:
             logging.error("Failed to open log file: %s", exc)
             self._csv = None
         try:
-            self._jsonl = open(self.jsonl_file, "a")
+            self._jsonl = open(self.jsonl_file, "ab", buffering=_WRITE_BUFFER)
         except Exception as exc:
             logging.error("Failed to open jsonl log file: %s", exc)
             self._jsonl = None
+        _live_loggers.add(self)
 
     def log_event(self, frequency_hz: float, text: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -52,33 +101,82 @@ class EventLogger:
         with self._lock:
             self._global_events.append(event)
 
-        if self._csv:
-            writer = csv.writer(self._csv)
-            writer.writerow([timestamp, f"{freq_mhz:.6f}", log_text])
-            self._csv.flush()
-        if self._jsonl:
-            try:
-                self._jsonl.write(json.dumps(event) + "\n")
-                self._jsonl.flush()
-            except Exception as exc:
-                logging.error("Failed to write jsonl event: %s", exc)
-        if self.transcript_index and log_text:
-            try:
-                self.transcript_index.add(log_text, {"time": timestamp, "freq": frequency_hz})
-            except Exception:
-                pass
+        with self._io_lock:
+            if self._csv:
+                self._csv_writer.writerow([timestamp, f"{freq_mhz:.6f}", log_text])
+            if self._jsonl:
+                try:
+                    self._jsonl.write(_jsonl_line(event))
+                except Exception as exc:
+                    logging.error("Failed to write jsonl event: %s", exc)
+            if self.transcript_index and log_text:
+                self._pending_index.append((log_text, {"time": timestamp, "freq": frequency_hz}))
+            batch = self._take_pending(self.index_batch)
+            self._schedule_flush()
+        self._index_batch(batch)
         return event
 
+    def _take_pending(self, min_size: int) -> List[tuple]:
+        # Caller holds _io_lock.
+        if len(self._pending_index) < max(min_size, 1):
+            return []
+        batch, self._pending_index = self._pending_index, []
+        return batch
+
+    def _index_batch(self, batch: List[tuple]) -> None:
+        if not batch or not self.transcript_index:
+            return
+        try:
+            self.transcript_index.add_many([t for t, _ in batch], [m for _, m in batch])
+        except Exception:
+            pass
+
+    def _schedule_flush(self) -> None:
+        # Caller holds _io_lock. One pending timer covers every write until it fires.
+        if self._flush_timer is None and (self._csv or self._jsonl or self._pending_index):
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Push buffered rows to disk and pending transcripts to the index."""
+        with self._io_lock:
+            self._flush_timer = None
+            for f in (self._csv, self._jsonl):
+                if f:
+                    try:
+                        f.flush()
+                        os.fsync(f.fileno())
+                    except (OSError, ValueError):
+                        pass
+            batch = self._take_pending(1)
+        self._index_batch(batch)
+        if self.transcript_index:
+            # Embed the tail here too: search() only sees what has been flushed.
+            self.transcript_index.flush()
+
+    @classmethod
+    def event_count(cls) -> int:
+        """Number of events logged in this process."""
+        with cls._lock:
+            return len(cls._global_events)
+
     @classmethod
     def recent_events(cls, n: int = 20) -> List[Dict[str, Any]]:
         with cls._lock:
             return list(cls._global_events[-n:])
 
     def close(self):
-        """Close files if open."""
-        if self._csv:
-            self._csv.close()
-            self._csv = None
-        if getattr(self, "_jsonl", None):
-            self._jsonl.close()
-            self._jsonl = None
+        """Flush and close files if open."""
+        timer = self._flush_timer
+        if timer is not None:
+            timer.cancel()
+        self.flush()
+        with self._io_lock:
+            if self._csv:
+                self._csv.close()
+                self._csv = None
+            if getattr(self, "_jsonl", None):
+                self._jsonl.close()
+                self._jsonl = None
+        _live_loggers.discard(self)
@@ -7,11 +7,98 @@ We keep per-channel state (frequency, mode, squelch, audio buffer) and
 demodulate multiple narrow channels out of a single wideband IQ stream.
 """
 
+import threading
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable
 import numpy as np
 
-from SDR.signal_processing import DemodulatorFactory, compute_power
+from SDR.signal_processing import DemodulatorFactory, time_base
+
+try:
+    # Prebuilt by `python -m SDR._dsp_aot`; no JIT at all when present.
+    from SDR.astrotrace_dsp import mix_c64
+except ImportError:
+    mix_c64 = None
+
+
+def _mix_loop(samples, lo, rows, rot, out):
+    """Mix ``samples`` by LO row ``rows[j]`` rotated by ``rot[rows[j]]`` into ``out[j]``."""
+    n = samples.shape[0]
+    for j in range(rows.shape[0]):
+        c = rows[j]
+        r = rot[c]
+        for i in range(n):
+            out[j, i] = samples[i] * lo[c, i] * r
+
+
+class _BackgroundJit:
+    """Numba build of ``_mix_loop`` compiled on a helper thread.
+
+    ``get()`` returns None (NumPy path) until the build is done, so the first
+    blocks never wait on the compiler inside the acquisition loop. The kernel is
+    serial: with a handful of channel rows a parallel build buys nothing and its
+    threading layer can keep the process from exiting.
+    """
+
+    def __init__(self) -> None:
+        self._kernel = None
+        self._started = False
+        self._lock = threading.Lock()
+
+    def get(self):
+        if not self._started:
+            with self._lock:
+                if not self._started:
+                    self._started = True
+                    threading.Thread(target=self._build, name="mix-jit", daemon=True).start()
+        return self._kernel
+
+    def _build(self) -> None:
+        try:
+            import numba
+        except ImportError:
+            return
+        kernel = numba.njit(cache=True, fastmath=True)(_mix_loop)
+        # Cached LO tables are read-only; warm up that specialization.
+        lo = np.ones((1, 1), dtype=np.complex64)
+        lo.flags.writeable = False
+        try:
+            kernel(
+                np.zeros(1, dtype=np.complex64),
+                lo,
+                np.zeros(1, dtype=np.int64),
+                np.ones(1, dtype=np.complex64),
+                np.empty((1, 1), dtype=np.complex64),
+            )
+        except Exception:
+            return
+        self._kernel = kernel
+
+
+_mix_jit = _BackgroundJit()
+
+
+# Squelch gate resolution: an L-point averaged spectrum gives every channel a band power
+# estimate for the price of one shared FFT, before any per-channel mixing.
+_GATE_FFT = 1024
+
+
+def _band_power(samples: np.ndarray, offsets: np.ndarray, half_widths: np.ndarray, sample_rate: float) -> np.ndarray:
+    """Mean-square of ``samples`` inside offset +/- half_width for each channel."""
+    n = samples.size
+    L = min(_GATE_FFT, n)
+    segs = n // L
+    spec = np.fft.fft(samples[: segs * L].reshape(segs, L), axis=-1)
+    # Parseval: sum over bins of |X|^2 / L^2 is the mean-square of the segment.
+    mag2 = np.square(spec.real)
+    mag2 += np.square(spec.imag)
+    psd = mag2.mean(axis=0) / float(L * L)
+    csum = np.concatenate(([0.0], np.cumsum(np.concatenate((psd, psd)))))  # doubled for wrap-around
+    centers = np.rint(offsets / sample_rate * L).astype(np.int64) % L
+    k = np.minimum(np.ceil(half_widths / sample_rate * L).astype(np.int64), L // 2)
+    start = (centers - k) % L
+    ms = csum[start + np.minimum(2 * k + 1, L)] - csum[start]
+    return np.maximum(ms, 0.0)
 
 
 @dataclass
@@ -19,6 +106,7 @@ class ChannelConfig:
     freq_hz: float
     mode: str = "FM"
     squelch_linear: float = 10 ** (-60.0 / 20.0)  # linear from dBFS
+    bandwidth_hz: float = 12_500.0  # span measured by the squelch gate
     enabled: bool = True
     name: str = ""
 
@@ -30,6 +118,7 @@ class ChannelState:
     audio_rms: float = 0.0
     last_audio: Optional[np.ndarray] = None
     last_power_db: float = -120.0
+    phase: float = 0.0  # LO phase (radians) carried into the next block
 
 
 class MultiChannelDemod:
@@ -41,6 +130,8 @@ class MultiChannelDemod:
         self.sample_rate = sample_rate
         self.channels: List[ChannelState] = []
         self.channel_added_cb = channel_added_cb
+        # (offsets, block size) -> read-only (C, N) LO table starting at phase 0.
+        self._lo_cache: Dict[tuple, np.ndarray] = {}
 
     def add_channel(self, cfg: ChannelConfig):
         state = ChannelState(
@@ -48,6 +139,7 @@ class MultiChannelDemod:
             demod=DemodulatorFactory.get(cfg.mode, audio_rate=16_000),
         )
         self.channels.append(state)
+        self._lo_cache.clear()
         if self.channel_added_cb:
             try:
                 self.channel_added_cb({"freq": cfg.freq_hz, "mode": cfg.mode})
@@ -56,36 +148,83 @@ class MultiChannelDemod:
 
     def remove_channel(self, freq_hz: float):
         self.channels = [c for c in self.channels if c.config.freq_hz != freq_hz]
+        self._lo_cache.clear()
 
     def set_channels(self, cfgs: List[ChannelConfig]):
         self.channels = []
+        self._lo_cache.clear()
         for cfg in cfgs:
             self.add_channel(cfg)
 
+    def _lo_table(self, offsets: tuple, n: int) -> np.ndarray:
+        """LO rows exp(-j*2*pi*offset*t) for one block, built once per tuning and block size."""
+        key = (offsets, n)
+        table = self._lo_cache.get(key)
+        if table is None:
+            if len(self._lo_cache) >= 8:
+                # Scanning cycles through a handful of centers; don't grow without bound.
+                self._lo_cache.clear()
+            # Cached float64 time axis keeps the angles exact before the complex64 cast.
+            ang = np.outer(np.asarray(offsets, dtype=np.float64) * (-2.0 * np.pi), time_base(n, self.sample_rate))
+            table = np.empty(ang.shape, dtype=np.complex64)
+            np.cos(ang, out=table.real)
+            np.sin(ang, out=table.imag)
+            table.flags.writeable = False
+            self._lo_cache[key] = table
+        return table
+
     def process(self, center_freq: float, samples: np.ndarray) -> List[Dict[str, Any]]:
         """Demod all enabled channels. Returns a list of audio/info dicts."""
         if samples.size == 0 or not self.channels:
             return []
+        active = [ch for ch in self.channels if ch.config.enabled]
+        if not active:
+            return []
         results = []
-        t = np.arange(samples.size, dtype=np.float32) / self.sample_rate
-        for ch in self.channels:
-            if not ch.config.enabled:
-                continue
-            # Mix to baseband
-            offset = ch.config.freq_hz - center_freq
-            lo = np.exp(-1j * 2.0 * np.pi * offset * t)
-            bb = samples * lo
-            power_lin = compute_power(bb)
-            power_db = 20 * np.log10(power_lin + 1e-6)
-            ch.last_power_db = power_db
-            if power_lin < ch.config.squelch_linear:
-                ch.last_audio = None
-                ch.audio_rms = 0.0
-                continue
+        n = samples.size
+        offsets = tuple(ch.config.freq_hz - center_freq for ch in active)
+        offsets_arr = np.asarray(offsets, dtype=np.float64)
+        half_widths = np.fromiter((0.5 * ch.config.bandwidth_hz for ch in active), dtype=np.float64, count=len(active))
+        squelch = np.fromiter((ch.config.squelch_linear for ch in active), dtype=np.float64, count=len(active))
+        power_all = _band_power(samples, offsets_arr, half_widths, self.sample_rate)
+        # Only channels above squelch in their own band get mixed and demodulated.
+        # Compared as mean-square vs squelch^2 so no sqrt is needed.
+        open_rows = np.flatnonzero(power_all >= squelch * squelch)
+
+        # Every channel's LO phase advances, so a channel that opens later stays continuous.
+        w = offsets_arr * (-2.0 * np.pi)
+        phases = np.fromiter((ch.phase for ch in active), dtype=np.float64, count=len(active))
+        for ch, w_ch in zip(active, w):
+            ch.phase = float((ch.phase + w_ch * n / self.sample_rate) % (2.0 * np.pi))
+        power_db_all = 10.0 * np.log10(power_all + 1e-12)
+        for ch, power_db in zip(active, power_db_all):
+            ch.last_power_db = float(power_db)
+            ch.last_audio = None
+            ch.audio_rms = 0.0
+        if open_rows.size == 0:
+            return results
+
+        # Mix the open channels against a cached phase-0 LO table; a per-row
+        # rotation carries each channel's phase across blocks.
+        lo = self._lo_table(offsets, n)
+        rot = np.exp(1j * phases).astype(np.complex64)
+        bb_open = np.empty((open_rows.size, n), dtype=np.complex64)
+        # One fused pass per channel, no rotated-LO temporaries.
+        kernel = mix_c64 or _mix_jit.get()
+        if kernel is not None:
+            iq = np.ascontiguousarray(samples, dtype=np.complex64)
+            kernel(iq, lo, open_rows, rot, bb_open)
+        else:
+            for j, c in enumerate(open_rows):
+                np.multiply(lo[c], samples, out=bb_open[j])
+                bb_open[j] *= rot[c]
+        for c, bb in zip(open_rows, bb_open):
+            ch = active[c]
+            power_db = ch.last_power_db
             audio = ch.demod.demod(bb, self.sample_rate)
             if audio.size > 0:
                 ch.last_audio = audio
-                ch.audio_rms = float(np.sqrt(np.mean(audio ** 2)))
+                ch.audio_rms = float(np.sqrt(np.dot(audio, audio) / audio.size))
                 results.append(
                     {
                         "freq_hz": ch.config.freq_hz,
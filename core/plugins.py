@@ -1,7 +1,15 @@
 import importlib
 import pkgutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Tuple
+
+
+def _import(modname: str) -> Tuple[Optional[Any], Optional[Exception]]:
+    try:
+        return importlib.import_module(f"plugins.{modname}"), None
+    except Exception as exc:
+        return None, exc
 
 
 def load_plugins(ui: Any, tab_widget: Any) -> None:
@@ -9,22 +17,28 @@ def load_plugins(ui: Any, tab_widget: Any) -> None:
     Discover and load plugins from astrotrace/plugins.
 
     A plugin is any module with a `register(ui, tab_widget)` function.
+    Modules are imported in parallel; `register` runs on the calling (UI)
+    thread, in discovery order.
     """
     plugins_dir = Path(__file__).resolve().parent.parent / "plugins"
     if not plugins_dir.exists():
         return
 
-    for _, modname, ispkg in pkgutil.iter_modules([str(plugins_dir)]):
-        if ispkg:
-            continue
+    names = [modname for _, modname, ispkg in pkgutil.iter_modules([str(plugins_dir)]) if not ispkg]
+    if not names:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+        imported = list(pool.map(_import, names))
+
+    for modname, (module, exc) in zip(names, imported):
         try:
-            module = importlib.import_module(f"plugins.{modname}")
+            if exc is not None:
+                raise exc
             if hasattr(module, "register"):
                 module.register(ui=ui, tab_widget=tab_widget)
         except Exception as exc:
             # Fail soft: do not break UI if a plugin errors.
             try:
-                ui.log_output.append(f"Plugin load failed: {modname}: {exc}")
+                ui.append_log(f"Plugin load failed: {modname}: {exc}")
             except Exception:
                 pass
-
@@ -1,8 +1,17 @@
+from functools import lru_cache
+
 import scipy.signal as signal
 
-def bandpass_filter(data, lowcut, highcut, fs, order=5):
-nyq = 0.5 * fs
-low = lowcut / nyq
-high = highcut / nyq
-b, a = signal.butter(order, [low, high], btype='band')
-return signal.filtfilt(b, a, data)
\ No newline at end of file
+
+@lru_cache(maxsize=32)
+def _design(order, lowcut, highcut, fs):
+    nyq = 0.5 * fs
+    return signal.butter(order, [lowcut / nyq, highcut / nyq], btype='band', output='sos')
+
+
+def bandpass_filter(data, lowcut, highcut, fs, order=5, zero_phase=True):
+    """Butterworth band-pass. ``zero_phase=False`` runs a single causal pass for streaming use."""
+    sos = _design(order, lowcut, highcut, fs)
+    if zero_phase:
+        return signal.sosfiltfilt(sos, data)
+    return signal.sosfilt(sos, data)
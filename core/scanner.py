@@ -1,18 +1,73 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import numpy as np
 from PyQt5.QtCore import QThread, pyqtSignal
 import time
 
 from SDR.sdr_ingest import create_sdr_source
 from SDR.signal_processing import compute_power, DemodulatorFactory
-from core.transcriber import Transcriber
 from core.logger import EventLogger
 from core.vector_store import TranscriptIndex
 from core import bundles
 from core.multi_demod import MultiChannelDemod, ChannelConfig
 
 
+@lru_cache(maxsize=1)
+def _fft_module():
+    """scipy.fft, imported on first use (keeps ``import core`` fast); numpy.fft without SciPy."""
+    try:
+        # scipy.fft keeps complex64 as complex64 and can work in the caller's buffer.
+        from scipy import fft
+    except ImportError:
+        return None
+    return fft
+
+
+SPECTRUM_BINS = 512
+
+
+class _Arena:
+    """Append-only sample buffer reused across events; grows only if an event outruns it."""
+
+    def __init__(self, capacity: int, dtype):
+        self.buf = np.empty(max(int(capacity), 1), dtype=dtype)
+        self.n = 0
+
+    def clear(self) -> None:
+        self.n = 0
+
+    def append(self, x: np.ndarray) -> None:
+        end = self.n + x.size
+        if end > self.buf.size:
+            grown = np.empty(max(end, 2 * self.buf.size), dtype=self.buf.dtype)
+            grown[: self.n] = self.buf[: self.n]
+            self.buf = grown
+        self.buf[self.n : end] = x
+        self.n = end
+
+    def view(self) -> np.ndarray:
+        """Samples so far; only valid until the next clear()/append()."""
+        return self.buf[: self.n]
+
+
+class _PcmArena(_Arena):
+    """_Arena that stores float audio as int16 PCM, quantized on append."""
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity, np.int16)
+        self._tmp = np.empty(0, dtype=np.float32)
+
+    def append(self, x: np.ndarray) -> None:
+        if self._tmp.size < x.size:
+            self._tmp = np.empty(x.size, dtype=np.float32)
+        tmp = self._tmp[: x.size]
+        np.multiply(x, np.float32(32767.0), out=tmp)
+        np.clip(tmp, -32768.0, 32767.0, out=tmp)
+        np.rint(tmp, out=tmp)
+        super().append(tmp)
+
+
 class ScannerThread(QThread):
     """
     Thread that handles scanning frequencies (or staying on one frequency in manual mode),
@@ -86,6 +141,9 @@ class ScannerThread(QThread):
         self.demodulator = DemodulatorFactory.get(mode=self.mode, audio_rate=self.audio_rate)
         self._announced_active = False
         self.multi_demod = None
+        self._fft_in = np.zeros((1, SPECTRUM_BINS), dtype=np.complex64)
+        self._fft_axis = None
+        self._fft_baseline_mhz = None
         try:
             self.now_playing.emit(self.start_freq, self.mode)
         except Exception:
@@ -95,9 +153,41 @@ class ScannerThread(QThread):
         if self.scan_mode:
             if self.step_freq <= 0:
                 return [self.start_freq]
-            return list(np.arange(self.start_freq, self.stop_freq + (self.step_freq * 0.5), self.step_freq))
+            return np.arange(self.start_freq, self.stop_freq + (self.step_freq * 0.5), self.step_freq).tolist()
         return [self.start_freq]
 
+    def _spectrum(self, samples: np.ndarray, freq: float):
+        """Return float32 (freqs_mhz, dB relative to peak) averaged over the whole block.
+
+        The block is cut into SPECTRUM_BINS-sized segments whose |X|^2 are
+        averaged (Bartlett), so every sample contributes to the display.
+        """
+        segs = max(samples.size // SPECTRUM_BINS, 1)
+        buf = self._fft_in
+        if buf.shape[0] != segs:
+            buf = self._fft_in = np.zeros((segs, SPECTRUM_BINS), dtype=np.complex64)
+        flat = buf.reshape(-1)
+        m = min(samples.size, flat.size)
+        flat[:m] = samples[:m]
+        flat[m:] = 0
+        sp_fft = _fft_module()
+        if sp_fft is not None:
+            spec = sp_fft.fft(buf, axis=-1, overwrite_x=True)
+        else:
+            spec = np.fft.fft(buf, axis=-1)
+        # |X|^2 in dB skips the sqrt of np.abs.
+        psd = (spec.real**2 + spec.imag**2).mean(axis=0)
+        fft_vals = np.fft.fftshift(10 * np.log10(psd + 1e-12))
+        fft_vals -= fft_vals.max()
+        if self._fft_axis is None or self._fft_axis[0] != freq:
+            # Offset axis in MHz is built once; a retune is a single scalar add.
+            if self._fft_baseline_mhz is None:
+                self._fft_baseline_mhz = np.linspace(-0.5, 0.5, SPECTRUM_BINS) * (self.sdr.sample_rate / 1e6)
+            axis = (self._fft_baseline_mhz + freq / 1e6).astype(np.float32)
+            self._fft_axis = (freq, axis)
+        # The UI consumes float32 contiguous arrays as-is; no conversion on its thread.
+        return self._fft_axis[1], np.ascontiguousarray(fft_vals, dtype=np.float32)
+
     def run(self):
         """Main thread loop: set up SDR and perform scanning or receiving."""
         try:
@@ -107,6 +197,8 @@ class ScannerThread(QThread):
                 center_freq=self.start_freq,
                 gain=self.gain,
                 filename=self.source_args.get("filename"),
+                # Hardware sources acquire on their own thread so USB waits overlap with DSP.
+                async_=self.source_type in ("rtl", "soapy"),
             )
         except Exception as e:
             self.signal_event.emit(f"SDR init failed: {e}")
@@ -119,6 +211,9 @@ class ScannerThread(QThread):
         # Transcription is optional; never block scanning/plots on model downloads.
         if self.enable_transcription and self.source_type != "synthetic":
             try:
+                # Imported here so Whisper/torch load only when transcription is on.
+                from core.transcriber import Transcriber
+
                 self.transcriber = Transcriber(model_size=self.transcription_model)
             except Exception as e:
                 msg = f"Transcriber init failed: {e}"
@@ -146,6 +241,7 @@ class ScannerThread(QThread):
                             freq_hz=float(c.get("freq_hz")),
                             mode=str(c.get("mode", "FM")),
                             squelch_linear=10 ** (float(c.get("squelch_db", -60.0)) / 20.0),
+                            bandwidth_hz=float(c.get("bandwidth_hz", 12_500.0)),
                             enabled=bool(c.get("enabled", True)),
                             name=str(c.get("name", "")),
                         )
@@ -155,8 +251,10 @@ class ScannerThread(QThread):
             self.multi_demod = MultiChannelDemod(sample_rate=self.sample_rate)
             self.multi_demod.set_channels(ch_cfgs)
 
-        audio_buffer = []
-        iq_buffer = []
+        # Event capture arenas sized for max_event_seconds, reused for every event.
+        iq_arena = _Arena(self.max_event_seconds * self.sdr.sample_rate + self.block_size, np.complex64)
+        # Event audio is kept as 16-bit PCM; live playback/metering use the float chunk.
+        audio_arena = _PcmArena(self.max_event_seconds * self.audio_rate + self.block_size)
         recording_freq = None
         quiet_count = 0
         quiet_threshold_blocks = 5
@@ -173,7 +271,11 @@ class ScannerThread(QThread):
                 self.sdr.tune(freq)
                 time.sleep(self.dwell_seconds)
 
-            samples = self.sdr.read_samples(self.block_size)
+            try:
+                samples = self.sdr.read_samples(self.block_size)
+            except Exception as e:
+                self.signal_event.emit(f"SDR read failed: {e}")
+                break
             if samples.size == 0:
                 break
 
@@ -183,10 +285,7 @@ class ScannerThread(QThread):
                 self.dwell_seconds = min(self.dwell_seconds, 0.12)
             if (now - last_ui_update) >= ui_period:
                 # Spectrum for UI (rate-limited)
-                fft_vals = 20 * np.log10(np.abs(np.fft.fftshift(np.fft.fft(samples, n=512))) + 1e-6)
-                fft_vals = fft_vals - np.max(fft_vals)
-                freqs = np.linspace(-0.5, 0.5, len(fft_vals)) * self.sdr.sample_rate + freq
-                self.signal_update.emit((freqs / 1e6, fft_vals))
+                self.signal_update.emit(self._spectrum(samples, freq))
                 last_ui_update = now
 
             power_linear = compute_power(samples)
@@ -209,8 +308,8 @@ class ScannerThread(QThread):
             if not active_signal and power_linear > self.squelch_linear:
                 active_signal = True
                 recording_freq = freq
-                audio_buffer = []
-                iq_buffer = []
+                iq_arena.clear()
+                audio_arena.clear()
                 quiet_count = 0
                 active_started_at = time.monotonic()
                 self._announced_active = True
@@ -220,10 +319,10 @@ class ScannerThread(QThread):
                     pass
 
             if active_signal and freq == recording_freq:
-                iq_buffer.append(np.copy(samples))
+                iq_arena.append(samples)
                 audio_chunk = self.demodulator.demod(samples, self.sdr.sample_rate)
                 if audio_chunk.size > 0:
-                    audio_buffer.append(audio_chunk)
+                    audio_arena.append(audio_chunk)
                     try:
                         rms = float(np.sqrt(np.mean(audio_chunk ** 2)))
                         self.audio_level.emit(rms)
@@ -245,7 +344,7 @@ class ScannerThread(QThread):
                     active_signal = False
                     quiet_count = 0
                     recording_freq = freq
-                    audio_data = np.concatenate(audio_buffer) if audio_buffer else np.array([], dtype=np.float32)
+                    audio_data = audio_arena.view()
                     event_elapsed = 0.0
                     if active_started_at is not None:
                         event_elapsed = time.monotonic() - active_started_at
@@ -266,10 +365,9 @@ class ScannerThread(QThread):
                     self.signal_event.emit(event)
                     if self.save_bundles and event_elapsed >= self.min_event_seconds:
                         try:
-                            iq_data = np.concatenate(iq_buffer) if iq_buffer else np.array([], dtype=np.complex64)
                             bundles.write_event_bundle(
                                 event=event,
-                                iq=iq_data,
+                                iq=iq_arena.view(),
                                 sample_rate=self.sdr.sample_rate,
                                 center_freq=recording_freq,
                                 mode=self.mode,
@@ -287,8 +385,8 @@ class ScannerThread(QThread):
                     if self.scan_mode:
                         time.sleep(self.hold_seconds)
                     recording_freq = None
-                    audio_buffer = []
-                    iq_buffer = []
+                    iq_arena.clear()
+                    audio_arena.clear()
                     active_started_at = None
                     self._announced_active = False
                     try:
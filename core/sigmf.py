@@ -2,22 +2,49 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from datetime import datetime, timezone
 import hashlib
 import numpy as np
 
+from ._hash import write_json_hashed
 
-def _sha256_file(path: Path) -> str:
+
+def _write_hashed(arr: np.ndarray, path: Path, chunk_bytes: int = 4 << 20) -> str:
+    """Copy ``arr`` into a memory-mapped file, hashing each chunk as it is written."""
+    flat = np.ascontiguousarray(arr).reshape(-1)
     h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+    if flat.size == 0:
+        path.write_bytes(b"")
+        return h.hexdigest()
+    out = np.memmap(path, dtype=flat.dtype, mode="w+", shape=flat.shape)
+    step = max(1, chunk_bytes // flat.itemsize)
+    for i in range(0, flat.size, step):
+        chunk = flat[i : i + step]
+        out[i : i + step] = chunk
+        h.update(chunk)
+    out.flush()
+    del out
     return h.hexdigest()
 
 
-def write_sigmf(iq: np.ndarray, sample_rate: float, center_freq: float, base_path: Path, extra: dict | None = None) -> dict:
+def quantize_ci8(iq: np.ndarray) -> tuple[np.ndarray, float]:
+    """Quantize complex IQ to interleaved int8 I/Q plus the scale that restores it."""
+    flat = np.asarray(iq, dtype=np.complex64).view(np.float32)
+    peak = float(np.max(np.abs(flat))) if flat.size else 0.0
+    scale = max(peak, 1e-12) / 127.0
+    q = np.clip(np.rint(flat / scale), -128, 127).astype(np.int8)
+    return q, scale
+
+
+def write_sigmf(
+    iq: np.ndarray,
+    sample_rate: float,
+    center_freq: float,
+    base_path: Path,
+    extra: dict | None = None,
+    datatype: str = "cf32_le",
+) -> dict:
     """Write IQ data and SigMF metadata sidecar.
 
     Args:
@@ -26,6 +53,8 @@ def write_sigmf(iq: np.ndarray, sample_rate: float, center_freq: float, base_pat
         center_freq: center frequency in Hz.
         base_path: base path without extension (e.g., /runs/case1/recording).
         extra: optional extra metadata to include under global namespace.
+        datatype: "cf32_le" (default) or "ci8", which stores 2 bytes/sample and
+            records the dequantization factor as ``astrotrace:iq_scale``.
 
     Returns:
         A dict with paths and hashes for manifest inclusion.
@@ -34,15 +63,22 @@ def write_sigmf(iq: np.ndarray, sample_rate: float, center_freq: float, base_pat
     data_path = base_path.with_suffix(".sigmf-data")
     meta_path = base_path.with_suffix(".sigmf-meta")
 
-    # Ensure correct dtype
-    iq = np.asarray(iq, dtype=np.complex64)
-    iq.tofile(data_path)
+    scale = None
+    if datatype == "ci8":
+        q, scale = quantize_ci8(iq)
+        data_sha = _write_hashed(q, data_path)
+    elif datatype == "cf32_le":
+        # Ensure correct dtype
+        iq = np.asarray(iq, dtype=np.complex64)
+        data_sha = _write_hashed(iq, data_path)
+    else:
+        raise ValueError(f"Unsupported SigMF datatype: {datatype}")
 
     now = datetime.now(timezone.utc).isoformat()
     meta = {
         "global": {
             "version": "0.0.1",
-            "core:datatype": "cf32_le",
+            "core:datatype": datatype,
             "core:sample_rate": sample_rate,
             "core:frequency": center_freq,
             "core:description": "AstroTrace event capture",
@@ -58,14 +94,15 @@ def write_sigmf(iq: np.ndarray, sample_rate: float, center_freq: float, base_pat
         ],
         "annotations": [],
     }
+    if scale is not None:
+        meta["global"]["astrotrace:iq_scale"] = scale
     if extra:
         meta["global"].update(extra)
 
-    with meta_path.open("w", encoding="utf-8") as f:
-        json.dump(meta, f, indent=2)
+    meta_sha = write_json_hashed(meta_path, meta)
 
     return {
-        "sigmf_data": {"path": str(data_path), "sha256": _sha256_file(data_path)},
-        "sigmf_meta": {"path": str(meta_path), "sha256": _sha256_file(meta_path)},
+        "sigmf_data": {"path": str(data_path), "sha256": data_sha},
+        "sigmf_meta": {"path": str(meta_path), "sha256": meta_sha},
     }
 
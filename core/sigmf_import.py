@@ -4,11 +4,26 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Iterator
 import numpy as np
 
 
-def read_sigmf(base_path: str | Path) -> tuple[np.ndarray, dict]:
-    """Read SigMF data/meta given base path (without extension or with .sigmf-meta)."""
+def _map(data_path: Path, dtype, offset: int) -> np.ndarray:
+    """Read-only memmap of the data file from ``offset``; pages load only when touched."""
+    count = max(data_path.stat().st_size - offset, 0) // np.dtype(dtype).itemsize
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(data_path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+
+def iter_chunks(arr: np.ndarray, n: int) -> Iterator[np.ndarray]:
+    """Yield consecutive ``n``-element views of ``arr``."""
+    for i in range(0, arr.size, n):
+        yield arr[i:i + n]
+
+
+def _open(base_path: str | Path, offset: int) -> tuple[np.ndarray, float | None, dict]:
+    """Map the raw data file; returns (raw, int scale or None for cf32, meta)."""
     base = Path(base_path)
     if base.suffix == ".sigmf-meta":
         base = base.with_suffix("")
@@ -20,6 +35,43 @@ def read_sigmf(base_path: str | Path) -> tuple[np.ndarray, dict]:
 
     with meta_path.open("r", encoding="utf-8") as f:
         meta = json.load(f)
-    raw = np.fromfile(data_path, dtype=np.complex64)
-    return raw, meta
+    glob = meta.get("global", {})
+    datatype = glob.get("core:datatype")
+    if datatype == "ci8":
+        scale = np.float32(glob.get("astrotrace:iq_scale", 1.0 / 127.0))
+        return _map(data_path, np.int8, offset), scale, meta
+    if datatype == "ci16_le":
+        return _map(data_path, "<i2", offset), np.float32(1.0 / 32768.0), meta
+    return _map(data_path, np.complex64, offset), None, meta
+
+
+def _decode(raw: np.ndarray, scale) -> np.ndarray:
+    if scale is None:
+        return raw
+    # Interleaved I/Q: a truncated file can end on a lone I value; drop it.
+    raw = raw[: raw.size - raw.size % 2]
+    return (raw.astype(np.float32) * scale).view(np.complex64)
+
+
+def read_sigmf(base_path: str | Path, offset: int = 0) -> tuple[np.ndarray, dict]:
+    """Read SigMF data/meta given base path (without extension or with .sigmf-meta).
+
+    cf32_le data comes back as a read-only ``np.memmap`` rather than being
+    loaded up front. ``offset`` skips leading bytes in the data file.
+    """
+    raw, scale, meta = _open(base_path, offset)
+    return _decode(raw, scale), meta
+
+
+def iter_sigmf_chunks(
+    base_path: str | Path, chunk_samples: int = 1 << 20, offset: int = 0
+) -> Iterator[np.ndarray]:
+    """Yield the capture as complex64 blocks of ``chunk_samples``.
 
+    cf32_le blocks are views into the memmap; integer formats are decoded one
+    block at a time, so the whole file is never converted at once.
+    """
+    raw, scale, _ = _open(base_path, offset)
+    per_sample = 1 if scale is None else 2
+    for block in iter_chunks(raw, chunk_samples * per_sample):
+        yield _decode(block, scale)
@@ -1,9 +1,21 @@
 import numpy as np
+
+from SDR.signal_processing import _resample
+
 try:
     import whisper
 except ImportError:
     whisper = None
 
+
+def _pick_device():
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except Exception:
+        return "cpu"
+
+
 class Transcriber:
     """
     Uses OpenAI Whisper model to transcribe audio to text.
@@ -11,13 +23,25 @@ class Transcriber:
     def __init__(self, model_size="base.en"):
         if whisper is None:
             raise ImportError("Whisper library is not installed.")
+        self.device = _pick_device()
         # Load the Whisper model (this can be time-consuming for large models)
-        self.model = whisper.load_model(model_size)
+        self.model = whisper.load_model(model_size, device=self.device)
+        # Half precision only pays off (and is only supported) on CUDA.
+        self.fp16 = self.device == "cuda"
+        # Clips up to one 30 s window are decoded directly from a reused padded
+        # buffer; Whisper caches its mel filterbank, so only the STFT runs per call.
+        self._pad = np.zeros(whisper.audio.N_SAMPLES, dtype=np.float32)
+        self._n_mels = getattr(self.model.dims, "n_mels", 80)
+        self._options = whisper.DecodingOptions(
+            fp16=self.fp16,
+            without_timestamps=True,
+            language="en" if model_size.endswith(".en") else None,
+        )
     
     def transcribe_audio(self, audio_data, sample_rate):
         """
         Transcribe the given audio data (numpy array) to text.
-        audio_data: numpy array of float32 audio samples.
+        audio_data: numpy array of float32 audio samples, or int16 PCM.
         sample_rate: sample rate of audio_data.
         Returns the transcribed text (string).
         """
@@ -25,21 +49,38 @@ class Transcriber:
             return ""
         # Whisper expects 16 kHz audio. If sample_rate is not 16000, resample or pad/trim:
         target_sr = 16000
-        audio = audio_data.astype(np.float32)
+        if audio_data.dtype == np.int16:
+            audio = np.multiply(audio_data, np.float32(1.0 / 32768.0), dtype=np.float32)
+        else:
+            audio = np.asarray(audio_data, dtype=np.float32)
         if sample_rate != target_sr:
-            # Resample audio to 16000 Hz
-            # (In practice, use a proper resampling method. Here we do a simple naive resample for demonstration.)
-            import math
-            resample_factor = target_sr / float(sample_rate)
-            new_length = int(math.ceil(len(audio) * resample_factor))
-            # Use numpy interpolation for resampling (simple approach)
-            audio = np.interp(np.linspace(0, len(audio), new_length, endpoint=False),
-                              np.arange(len(audio)), audio)
+            # Anti-aliased polyphase resample (np.interp fallback when SciPy is missing)
+            audio = _resample(audio, sample_rate, target_sr)
         # The whisper library expects the audio to be a numpy array of floats in range [-1,1]
-        # Ensure audio is normalized
-        if np.max(np.abs(audio)) > 0:
-            audio = audio / np.max(np.abs(audio))
-        # Use the whisper model to transcribe
-        result = self.model.transcribe(audio, fp16=False)
+        # Peak from max/min avoids an abs() temporary; scale in place unless still the caller's buffer.
+        peak = max(float(audio.max()), -float(audio.min())) if audio.size else 0.0
+        if peak > 1e-12:
+            inv = np.float32(1.0 / peak)
+            if np.shares_memory(audio, audio_data):
+                audio = audio * inv
+            else:
+                np.multiply(audio, inv, out=audio)
+        if audio.size <= self._pad.size:
+            self._pad[:audio.size] = audio
+            self._pad[audio.size:] = 0.0
+            mel = whisper.log_mel_spectrogram(self._pad, n_mels=self._n_mels, device=self.device)
+            return self.model.decode(mel, self._options).text.strip()
+        # Longer clips go through the windowed high-level path
+        result = self.model.transcribe(audio, fp16=self.fp16)
         text = result.get("text", "").strip()
         return text
+
+    def transcribe_file(self, path):
+        """
+        Transcribe an audio file on disk (Whisper decodes it via ffmpeg).
+        Returns the transcribed text (string).
+        """
+        if whisper is None:
+            return ""
+        result = self.model.transcribe(str(path), fp16=self.fp16)
+        return result.get("text", "").strip()
@@ -1,14 +1,21 @@
-def compute_power(samples):
-"""Compute average signal power from complex samples."""
+from datetime import datetime, timezone
+
 import numpy as np
-return np.mean(np.abs(samples) ** 2)
+
+
+def compute_power(samples):
+    """Compute average signal power from complex samples."""
+    s = np.ascontiguousarray(samples)
+    if s.size == 0:
+        return 0.0
+    # vdot conjugates its first argument: sum(|x|^2) in one BLAS pass, no temporaries.
+    return float(np.vdot(s, s).real) / s.size
 
 
 def frequency_to_mhz(freq):
-"""Convert Hz to MHz with 3 decimal places."""
-return round(freq / 1e6, 3)
+    """Convert Hz to MHz with 3 decimal places."""
+    return round(freq / 1e6, 3)
 
 
 def timestamp_now():
-from datetime import datetime
-return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
\ No newline at end of file
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -1,6 +1,24 @@
 """Lightweight transcript index with optional FAISS backend."""
 
-from typing import List, Dict, Any
+import re
+import threading
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+
+try:
+    import faiss  # type: ignore
+except ImportError:
+    faiss = None
+
+# Exact search until there is enough data to train the compressed index
+# (FAISS wants ~39 training points per IVF list).
+_IVF_SPEC = "IVF256,PQ8x8"
+_IVF_TRAIN_MIN = 256 * 39
+_IVF_NPROBE = 8
+_EMBED_BATCH = 64
+_TOKEN_RE = re.compile(r"\w+")
 
 
 class TranscriptIndex:
@@ -9,57 +27,164 @@ class TranscriptIndex:
     FAISS + embeddings are used if available; otherwise we fall back to a
     simple substring filter over the in-memory list. This keeps the runtime
     tolerant when optional deps or API keys are missing.
+
+    Vectors start in an exact flat index; once enough have accumulated they
+    are moved into an IVF-PQ index (8-byte codes, ``nprobe`` lists per query)
+    so memory and query time stay bounded over long sessions. FAISS ids are
+    positions in ``_entries``.
+
+    Texts are embedded in batches of ``batch`` (and on ``flush()``) so the
+    embedding model is not re-entered once per transcript. ``search()`` never
+    embeds pending texts itself: it queries what is already indexed, so a UI
+    caller does not wait on a batch that a writer thread has yet to flush.
+    All state is guarded by ``_lock``; ``_flush_lock`` serializes the
+    (slow) embedding pass and its scratch buffer without holding ``_lock``.
+
+    ``version`` changes whenever transcripts are added, so callers
+    can cache search results against it.
     """
 
-    def __init__(self):
-        self._use_faiss = False
+    def __init__(self, batch: int = _EMBED_BATCH):
+        # Embeddings are loaded on first flush, not at construction.
+        self._use_faiss = faiss is not None
         self._entries: List[Dict[str, Any]] = []
-        self._vector_store = None
+        self._index = None
+        self._train_vectors: Optional[List[np.ndarray]] = []
         self._embedding_model = None
+        self._batch = max(int(batch), 1)
+        self._pending: List[str] = []
+        self._buf: Optional[np.ndarray] = None
+        # Keyword fallback: lowercased texts plus token -> entry-id postings.
+        self._lower: List[str] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self.version = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
 
-        try:
-            from langchain_community.vectorstores import FAISS  # type: ignore
-            from langchain_community.embeddings import HuggingFaceEmbeddings  # type: ignore
+    def _ensure_model(self) -> bool:
+        # Caller holds _flush_lock; the model loads without blocking searches.
+        if self._embedding_model is None and self._use_faiss:
+            try:
+                from langchain_community.embeddings import HuggingFaceEmbeddings  # type: ignore
 
-            self._embedding_model = HuggingFaceEmbeddings()
-            self._vector_store = FAISS.from_texts([], self._embedding_model)
-            self._use_faiss = True
-        except Exception:
-            # Optional dependency not available; fall back to in-memory list.
-            self._use_faiss = False
+                model = HuggingFaceEmbeddings()
+            except Exception:
+                # Optional dependency not available; fall back to in-memory list.
+                model = None
+            with self._lock:
+                self._embedding_model = model
+                self._use_faiss = model is not None
+        return self._use_faiss
 
     def add(self, text: str, metadata: Dict[str, Any]):
         """Add a transcript to the index."""
-        entry = {"text": text, **metadata}
-        self._entries.append(entry)
-        if self._use_faiss and self._vector_store is not None:
+        self.add_many([text], [metadata])
+
+    def add_many(self, texts: List[str], metadatas: List[Dict[str, Any]]):
+        """Add several transcripts; embedding is deferred to the next full batch."""
+        with self._lock:
+            for t, m in zip(texts, metadatas):
+                entry = {"text": t, **m}
+                idx = len(self._entries)
+                self._entries.append(entry)
+                low = str(entry.get("text", "")).lower()
+                self._lower.append(low)
+                for tok in set(_TOKEN_RE.findall(low)):
+                    self._postings[tok].append(idx)
+            self.version += 1
+            if not self._use_faiss:
+                return
+            self._pending.extend(texts)
+            full = len(self._pending) >= self._batch
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Embed and index any queued transcripts."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending or not self._ensure_model():
+                return
             try:
-                self._vector_store.add_texts([text], [metadata])
+                for start in range(0, len(pending), self._batch):
+                    chunk = pending[start:start + self._batch]
+                    self._add_vectors(self._embed(chunk))
             except Exception:
                 # If FAISS insert fails, silently degrade to list-only.
-                self._use_faiss = False
+                with self._lock:
+                    self._use_faiss = False
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        embs = self._embedding_model.embed_documents(texts)
+        n = len(embs)
+        if self._buf is None:
+            self._buf = np.empty((self._batch, len(embs[0])), dtype=np.float32)
+        out = self._buf[:n]
+        out[...] = embs
+        return out
+
+    def _add_vectors(self, vecs: np.ndarray) -> None:
+        # Caller holds _flush_lock, so only searches can race with this.
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexFlatL2(vecs.shape[1])
+            self._index.add(vecs)
+            if self._train_vectors is None or self._index.ntotal < _IVF_TRAIN_MIN:
+                if self._train_vectors is not None:
+                    self._train_vectors.append(vecs.copy())
+                return
+        # Train outside _lock; searches keep using the flat index meanwhile.
+        xb = np.concatenate(self._train_vectors + [vecs])
+        ivf = faiss.index_factory(xb.shape[1], _IVF_SPEC)
+        ivf.train(xb)
+        ivf.add(xb)
+        ivf.nprobe = _IVF_NPROBE
+        with self._lock:
+            self._index = ivf
+            self._train_vectors = None
 
     def search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
-        """Search transcripts and return best matches."""
-        if self._use_faiss and self._vector_store is not None:
+        """Search what is indexed so far and return best matches."""
+        with self._lock:
+            ready = self._use_faiss and self._index is not None and self._index.ntotal
+            model = self._embedding_model if ready else None
+        if model is not None:
             try:
-                docs = self._vector_store.similarity_search(query, k=k)
-                results = []
-                for doc in docs:
-                    results.append(
-                        {
-                            "text": doc.page_content,
-                            **(doc.metadata or {}),
-                        }
-                    )
-                return results
+                q = np.asarray(model.embed_query(query), dtype=np.float32)
+                with self._lock:
+                    _, ids = self._index.search(q[None, :], k)
+                    return [dict(self._entries[i]) for i in ids[0] if 0 <= i < len(self._entries)]
             except Exception:
                 # fall through to keyword search
                 pass
-        # Keyword fallback: filter by substring and return most recent first
-        matches = [e for e in self._entries if query.lower() in e.get("text", "").lower()]
-        return list(reversed(matches))[:k]
+        # Keyword fallback: substring match, most recent first
+        q = query.lower()
+        with self._lock:
+            hits = [i for i in reversed(self._candidates(q)) if q in self._lower[i]]
+            return [dict(self._entries[i]) for i in hits[:k]]
 
-    def last(self, n: int = 10) -> List[Dict[str, Any]]:
-        return list(self._entries[-n:])
+    def _candidates(self, q: str) -> Sequence[int]:
+        """Ascending entry ids that may contain substring ``q``. Caller holds ``_lock``."""
+        spans = [(m.start(), m.end()) for m in _TOKEN_RE.finditer(q)]
+        # Tokens with a non-word char on both sides must appear whole in a match.
+        whole = {q[a:b] for a, b in spans if a > 0 and b < len(q)}
+        if whole:
+            lists = sorted((self._postings.get(t, []) for t in whole), key=len)
+            ids = set(lists[0])
+            for other in lists[1:]:
+                ids.intersection_update(other)
+            return sorted(ids)
+        if len(spans) == 1:
+            # A lone (possibly partial) word: union postings of tokens containing it.
+            part = q[spans[0][0]:spans[0][1]]
+            ids = set()
+            for tok, posting in self._postings.items():
+                if part in tok:
+                    ids.update(posting)
+            return sorted(ids)
+        return range(len(self._lower))
 
+    def last(self, n: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._entries[-n:])
@@ -32,7 +32,7 @@ def register(ui, tab_widget):
             freq = random.uniform(88.0, 108.0)
             score = random.uniform(0.6, 0.99)
             add_entry(freq, score)
-        ui.log_output.append("Anomaly radar: added simulated anomalies.")
+        ui.append_log("Anomaly radar: added simulated anomalies.")
 
     btn_sim.clicked.connect(simulate)
     tab_widget.addTab(panel, "Anomaly")
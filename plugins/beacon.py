@@ -38,7 +38,7 @@ def register(ui, tab_widget):
 
     def tick():
         status.append("Beacon frame sent (simulated).")
-        ui.log_output.append("Beacon: simulated frame sent.")
+        ui.append_log("Beacon: simulated frame sent.")
 
     def start():
         msg = msg_edit.text().strip() or "Hello from AstroTrace"
@@ -53,7 +53,7 @@ def register(ui, tab_widget):
     def reply():
         reply_text = "Simulated reply detected. Copilot would craft a response."
         status.append(reply_text)
-        ui.log_output.append(reply_text)
+        ui.append_log(reply_text)
         ui._push_ai_insight("Simulated reply received; suggest switching to RX focus.")
 
     timer.timeout.connect(tick)
@@ -2,10 +2,12 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton
 import os
 import re
 
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+
 
 def _fallback_plan(goal: str):
     # Simple heuristic scan plan
-    numbers = re.findall(r"(\d+\.?\d*)", goal)
+    numbers = _NUM_RE.findall(goal)
     band = "88-108 MHz" if len(numbers) < 2 else f"{numbers[0]}-{numbers[1]} MHz"
     return [
         f"Band: {band}",
@@ -63,7 +65,7 @@ def register(ui, tab_widget):
         list_widget.clear()
         for ln in lines:
             list_widget.addItem(ln)
-        ui.log_output.append("Playbook generated.")
+        ui.append_log("Playbook generated.")
 
     btn.clicked.connect(generate)
     tab_widget.addTab(panel, "Playbooks")
@@ -70,7 +70,7 @@ def register(ui, tab_widget):
     def append(msg: str):
         log.append(msg)
         try:
-            ui.log_output.append(msg)
+            ui.append_log(msg)
         except Exception:
             pass
 
@@ -104,6 +104,9 @@ def register(ui, tab_widget):
         try:
             import json
             data = json.loads(path.read_text())
+            if "same_as" in data:
+                # Stub for a run identical to an earlier one: show that body with this run's timing.
+                data = {**json.loads((reports_dir / data["same_as"]).read_text()), **data}
             log.setPlainText(_summarize_report(data))
         except Exception as exc:
             append(f"Failed to open report: {exc}")
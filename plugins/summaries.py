@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QTextEdit
 import os
 
+import numpy as np
+
 try:
     from langchain_community.chat_models import ChatOpenAI  # type: ignore
 except Exception:
@@ -14,10 +16,9 @@ def _fallback_summary(events):
         return "No recent events."
     lines = []
     lines.append(f"{len(events)} events in the recent window.")
-    freqs = [e.get("freq", 0.0) / 1e6 for e in events if "freq" in e]
-    if freqs:
-        freqs = sorted(freqs)
-        lines.append(f"Freq span: {freqs[0]:.3f}–{freqs[-1]:.3f} MHz")
+    freqs = np.fromiter((e["freq"] for e in events if "freq" in e), dtype=np.float64)
+    if freqs.size:
+        lines.append(f"Freq span: {freqs.min() / 1e6:.3f}–{freqs.max() / 1e6:.3f} MHz")
     texts = [e.get("text", "") for e in events if e.get("text")]
     if texts:
         sample = texts[-1][:120]
@@ -63,7 +64,7 @@ def register(ui, tab_widget):
         events = EventLogger.recent_events(30)
         text = _llm_summary(events) or _fallback_summary(events)
         output.setPlainText(text)
-        ui.log_output.append("Summary refreshed.")
+        ui.append_log("Summary refreshed.")
 
     btn.clicked.connect(run_summary)
     tab_widget.addTab(panel, "Summaries")
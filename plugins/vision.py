@@ -27,21 +27,19 @@ def register(ui, tab_widget):
     grid.setSpacing(6)
     layout.addWidget(grid_host)
 
+    # Tiles are built once and repainted on each capture.
+    tiles = []
+    for idx in range(6):
+        label = QLabel()
+        label.setFixedSize(96, 64)
+        grid.addWidget(label, *divmod(idx, 3))
+        tiles.append((label, QPixmap(96, 64)))
+
     def do_capture():
-        for idx in range(6):
-            pix = QPixmap(96, 64)
-            color = QColor.fromHsv(random.randint(0, 359), 200, 230)
-            pix.fill(color)
-            label = QLabel()
+        for label, pix in tiles:
+            pix.fill(QColor.fromHsv(random.randint(0, 359), 200, 230))
             label.setPixmap(pix)
-            r, c = divmod(idx, 3)
-            existing = grid.itemAtPosition(r, c)
-            if existing:
-                old = existing.widget()
-                if old:
-                    old.deleteLater()
-            grid.addWidget(label, r, c)
-        ui.log_output.append("Vision: captured burst (simulated).")
+        ui.append_log("Vision: captured burst (simulated).")
 
     btn_capture.clicked.connect(do_capture)
 
@@ -2,24 +2,32 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
+import shutil
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import Callable, Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 
 import numpy as np
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QEventLoop, QThread, QTimer, pyqtSignal
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+from core._hash import json_bytes, json_loads
 from core.scanner import ScannerThread
 from core.agent import RadioOpsAgent, RadioController
 from core.vector_store import TranscriptIndex
 from core.logger import EventLogger
-from core.sigmf_import import read_sigmf
-from SDR.sdr_ingest import create_sdr_source
-from SDR.signal_processing import compute_power, DemodulatorFactory
-from core.multi_demod import MultiChannelDemod, ChannelConfig
-from core.transcriber import Transcriber
 
 
 @dataclass
@@ -27,44 +35,185 @@ class Scenario:
     name: str
     run: Callable[[], Dict[str, Any]]
     timeout: float = 20.0
+    # Scenarios sharing a group (e.g. one RTL dongle) run one at a time.
+    group: Optional[str] = None
+
+
+@dataclass
+class Overrides:
+    """Tunables persisted between regression runs (auto-tune may adjust them)."""
+
+    # None until set (by hand or auto-tune): each scenario then uses its own default.
+    squelch_db: Optional[float] = None
+    rtl_center_mhz: float = 100.0
+
+    def squelch(self, default: float) -> float:
+        return default if self.squelch_db is None else self.squelch_db
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Overrides":
+        if not isinstance(data, dict):
+            return cls()
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+# Slack on top of a scenario's own timeout before its result is abandoned.
+_TIMEOUT_GRACE = 5.0
+# Report fields that change every run and are ignored when deduplicating reports.
+_VOLATILE_REPORT_KEYS = ("timestamp", "duration_sec", "path")
+# Spectrum frames rtl_scan_power waits for before stopping early.
+_RTL_TARGET_FRAMES = 20
+
+
+# Fixtures draw from their own PCG64 stream seeded with this, never the legacy
+# global np.random state, so concurrent scenarios neither contend nor perturb each other.
+_FIXTURE_SEED = 0xA5700
+
+# Half a second of 16 kHz silence for the Whisper smoke test; the transcriber never writes to its input.
+_WHISPER_SILENCE = np.zeros(8000, dtype=np.float32)
+_WHISPER_SILENCE.flags.writeable = False
+
+
+@functools.lru_cache(maxsize=1)
+def _make_multi_demod_iq(sr: float = 256_000.0, n: int = 4096) -> np.ndarray:
+    """Seeded noise plus tones at 12 and 30 kHz; built once and shared read-only."""
+    rng = np.random.default_rng(_FIXTURE_SEED)
+    iq = np.empty(n, dtype=np.complex64)
+    # Noise is drawn straight into the interleaved float32 view; tones accumulate in place.
+    rng.standard_normal(out=iq.view(np.float32), dtype=np.float32)
+    iq *= np.float32(0.05)
+    k = np.arange(n, dtype=np.float32)
+    w1, w2 = (np.float32(2 * np.pi * f / sr) for f in (12_000, 30_000))
+    if ne is not None:
+        # Both tones in one fused, vectorized sincos pass.
+        iq += ne.evaluate("0.2 * exp(1j * w1 * k) + 0.2 * exp(1j * w2 * k)").astype(np.complex64, copy=False)
+    else:
+        for w in (w1, w2):
+            iq += np.float32(0.2) * np.exp(1j * w * k).astype(np.complex64, copy=False)
+    iq.flags.writeable = False
+    return iq
+
+
+class _ReplyCache:
+    """SQLite cache of agent replies keyed on the normalized prompt (exact match only)."""
+
+    def __init__(self, path: Path, ttl: float = 24 * 3600.0):
+        self.path = path
+        self.ttl = ttl
+        with sqlite3.connect(self.path) as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS replies (key TEXT PRIMARY KEY, reply TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            db.execute("DELETE FROM replies WHERE created < ?", (time.time() - self.ttl,))
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.sha1(prompt.strip().lower().encode("utf-8")).hexdigest()
+
+    def get(self, prompt: str) -> Optional[str]:
+        with sqlite3.connect(self.path) as db:
+            row = db.execute(
+                "SELECT reply FROM replies WHERE key = ? AND created >= ?", (self._key(prompt), time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, prompt: str, reply: str) -> None:
+        with sqlite3.connect(self.path) as db:
+            db.execute(
+                "INSERT OR REPLACE INTO replies (key, reply, created) VALUES (?, ?, ?)",
+                (self._key(prompt), reply, time.time()),
+            )
 
 
 def _latest_bundle(bundle_root: Path) -> Path | None:
-    if not bundle_root.exists():
+    try:
+        with os.scandir(bundle_root) as it:
+            dirs = [(e.stat().st_mtime, e.name) for e in it if e.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
         return None
-    dirs = [p for p in bundle_root.iterdir() if p.is_dir()]
     if not dirs:
         return None
-    return max(dirs, key=lambda p: p.stat().st_mtime)
+    return bundle_root / max(dirs)[1]
 
 
 class RegressionRunner(QThread):
     progress = pyqtSignal(str)
     finished_report = pyqtSignal(dict)
 
-    def __init__(self, use_rtl: bool = False, auto_tune: bool = True, parent=None):
+    _overrides_cache: Dict[str, tuple] = {}
+
+    def __init__(self, use_rtl: bool = False, auto_tune: bool = True, use_agent_cache: bool = False, parent=None):
         super().__init__(parent)
         self.use_rtl = use_rtl
         self.auto_tune = auto_tune
+        self.use_agent_cache = use_agent_cache
         self.report_root = Path("test_reports")
         self.report_root.mkdir(exist_ok=True)
         self.overrides_path = self.report_root / "overrides.json"
         self.overrides = self._load_overrides()
 
-    def _load_overrides(self) -> Dict[str, Any]:
-        if self.overrides_path.exists():
+    def _load_overrides(self) -> Overrides:
+        # Parsed overrides are shared across runners until the file's mtime changes.
+        self._last_overrides_hash = None
+        try:
+            mtime = self.overrides_path.stat().st_mtime_ns
+        except OSError:
+            return Overrides()
+        key = str(self.overrides_path.resolve())
+        cached = RegressionRunner._overrides_cache.get(key)
+        if cached is None or cached[0] != mtime:
             try:
-                return json.loads(self.overrides_path.read_text())
+                raw = self.overrides_path.read_bytes()
+                cached = (mtime, json_loads(raw), hashlib.sha1(raw).hexdigest())
             except Exception:
-                return {}
-        return {}
-
-    def _save_overrides(self, data: Dict[str, Any]) -> None:
+                return Overrides()
+            RegressionRunner._overrides_cache[key] = cached
+        self._last_overrides_hash = cached[2]
+        return Overrides.from_dict(cached[1])
+
+    def _save_overrides(self, overrides: Overrides) -> None:
+        # Unset tunables stay out of the file, as before the dataclass.
+        data = {k: v for k, v in asdict(overrides).items() if v is not None}
+        raw = json_bytes(data)
+        digest = hashlib.sha1(raw).hexdigest()
+        if digest == self._last_overrides_hash:
+            return
         try:
-            self.overrides_path.write_text(json.dumps(data, indent=2))
+            self.overrides_path.write_bytes(raw)
+            self._last_overrides_hash = digest
+            RegressionRunner._overrides_cache[str(self.overrides_path.resolve())] = (
+                self.overrides_path.stat().st_mtime_ns,
+                data,
+                digest,
+            )
         except Exception:
             pass
 
+    def _write_report(self, report: Dict[str, Any]) -> Path:
+        """Write this run's report; a run matching the previous body gets a stub pointing at it.
+
+        The stub carries this run's timestamp, duration and pass flag plus
+        ``same_as``, the file name of the full report it repeats.
+        """
+        stable = {k: v for k, v in report.items() if k not in _VOLATILE_REPORT_KEYS}
+        canonical = json.dumps(stable, sort_keys=True, default=str).encode("utf-8")
+        digest = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+        pointer = self.report_root / ".last_hash"
+        try:
+            last_digest, last_name = pointer.read_text().split()
+        except (OSError, ValueError):
+            last_digest, last_name = None, None
+        report_path = self.report_root / f"report_{int(time.time())}.json"
+        if digest == last_digest and (self.report_root / last_name).exists():
+            stub = {k: report[k] for k in _VOLATILE_REPORT_KEYS if k in report and k != "path"}
+            stub.update(passed=report.get("passed"), same_as=last_name)
+            report_path.write_bytes(json_bytes(stub))
+            return report_path
+        report_path.write_bytes(json_bytes(report))
+        pointer.write_text(f"{digest} {report_path.name}\n")
+        return report_path
+
     def _emit(self, msg: str):
         try:
             self.progress.emit(msg)
@@ -73,16 +222,18 @@ class RegressionRunner(QThread):
 
     # ---------- Scenarios ----------
 
+    @staticmethod
+    def _new_transcript_index() -> TranscriptIndex:
+        # One per scenario: scenarios run concurrently and must not see each other's transcripts.
+        # Cheap, since the embedding model only loads on a scenario's first flush.
+        return TranscriptIndex()
+
     def _scenario_synthetic_scan(self) -> Dict[str, Any]:
         """Run scanner on synthetic source and expect >=1 event + bundle."""
         bundle_root = Path("runs_tests")
-        if bundle_root.exists():
-            for item in bundle_root.iterdir():
-                if item.is_dir():
-                    for f in item.glob("*"):
-                        f.unlink(missing_ok=True)
-                    item.rmdir()
-        transcript_idx = TranscriptIndex()
+        shutil.rmtree(bundle_root, ignore_errors=True)
+        bundle_root.mkdir(parents=True, exist_ok=True)
+        transcript_idx = self._new_transcript_index()
         agent = RadioOpsAgent(
             controller=RadioController(
                 tune_fn=lambda *args, **kwargs: "ok",
@@ -99,7 +250,7 @@ class RegressionRunner(QThread):
             freq_range=(100e6, 100e6, 0),  # single freq to complete event
             mode="FM",
             gain=None,
-            squelch_db=self.overrides.get("squelch_db", -80.0),
+            squelch_db=self.overrides.squelch(-80.0),
             scan_mode=True,
             sample_rate=250_000,
             source_type="synthetic" if not self.use_rtl else "rtl",
@@ -114,16 +265,18 @@ class RegressionRunner(QThread):
             save_bundles=True,
         )
 
+        # Scanner signals are queued to this thread, so they need a running loop here.
+        loop = QEventLoop()
+
         def on_event(ev):
             events.append(ev)
+            if isinstance(ev, dict):
+                loop.quit()
 
         scanner.signal_event.connect(on_event)
+        QTimer.singleShot(20_000, loop.quit)
         scanner.start()
-        start = time.time()
-        while time.time() - start < 20.0:
-            if any(isinstance(e, dict) for e in events):
-                break
-            time.sleep(0.25)
+        loop.exec_()
         scanner.requestInterruption()
         scanner.wait(2000)
 
@@ -134,26 +287,29 @@ class RegressionRunner(QThread):
             data = bundle / "capture.sigmf-data"
             bundle_ok = meta.exists() and data.exists()
             if bundle_ok:
+                from core.sigmf_import import iter_sigmf_chunks
+
                 try:
-                    read_sigmf(bundle / "capture")
+                    # Decode every block, one at a time, without converting the whole capture.
+                    for _ in iter_sigmf_chunks(bundle / "capture"):
+                        pass
                 except Exception:
                     bundle_ok = False
 
         result = {
             "events": len([e for e in events if isinstance(e, dict)]),
             "bundle_found": bool(bundle_ok),
-            "squelch_db": self.overrides.get("squelch_db", -60.0),
+            "squelch_db": self.overrides.squelch(-60.0),
         }
         result["passed"] = result["events"] >= 1 and result["bundle_found"]
         if self.auto_tune and result["events"] == 0:
             # Self-correct: lower squelch by 10 dB for next run
-            new_sq = max(-100.0, self.overrides.get("squelch_db", -60.0) - 10.0)
-            self.overrides["squelch_db"] = new_sq
+            self.overrides.squelch_db = max(-100.0, self.overrides.squelch(-60.0) - 10.0)
         return result
 
     def _scenario_agent(self) -> Dict[str, Any]:
         """Verify agent responds to logs/search commands."""
-        transcript_idx = TranscriptIndex()
+        transcript_idx = self._new_transcript_index()
         controller = RadioController(
             tune_fn=lambda *a, **k: "tuned",
             scan_fn=lambda *a, **k: "scan",
@@ -174,6 +330,9 @@ class RegressionRunner(QThread):
         """Open RTL device, read samples, verify non-empty and sane power."""
         if not self.use_rtl:
             return {"passed": True, "skipped": True, "reason": "use_rtl disabled"}
+        from SDR.sdr_ingest import create_sdr_source
+        from SDR.signal_processing import compute_power
+
         try:
             src = create_sdr_source(kind="rtl", sample_rate=250_000, center_freq=100e6, gain=None)
             samples = src.read_samples(2048)
@@ -187,14 +346,15 @@ class RegressionRunner(QThread):
         """Run a short scan on RTL and confirm samples flow (no event requirement)."""
         if not self.use_rtl:
             return {"passed": True, "skipped": True, "reason": "use_rtl disabled"}
-        freq = float(self.overrides.get("rtl_center_mhz", 100.0)) * 1e6
+        freq = float(self.overrides.rtl_center_mhz) * 1e6
         events: List[Any] = []
-        powers: List[float] = []
+        powers = np.empty(1024, dtype=np.float32)
+        seen = [0]
         scanner = ScannerThread(
             freq_range=(freq, freq, 0),
             mode="FM",
             gain=30,
-            squelch_db=self.overrides.get("squelch_db", -60.0),
+            squelch_db=self.overrides.squelch(-60.0),
             scan_mode=False,
             sample_rate=250_000,
             source_type="rtl",
@@ -208,6 +368,8 @@ class RegressionRunner(QThread):
             save_bundles=False,
         )
 
+        loop = QEventLoop()
+
         def on_event(ev):
             events.append(ev)
 
@@ -215,30 +377,33 @@ class RegressionRunner(QThread):
             try:
                 _, p = spec
                 if len(p):
-                    powers.append(float(np.max(p)))
+                    powers[seen[0] % powers.size] = p.max()
+                    seen[0] += 1
+                    if seen[0] >= _RTL_TARGET_FRAMES:
+                        loop.quit()
             except Exception:
                 pass
 
         scanner.signal_event.connect(on_event)
         scanner.signal_update.connect(on_update)
+        QTimer.singleShot(12_000, loop.quit)
         scanner.start()
-        time.sleep(12.0)
+        loop.exec_()
         scanner.requestInterruption()
         scanner.wait(2000)
+        n = seen[0]
         return {
-            "passed": len(powers) > 0,
-            "samples_seen": len(powers),
-            "max_power_db": float(np.max(powers)) if powers else None,
+            "passed": n > 0,
+            "samples_seen": n,
+            "max_power_db": float(powers[:min(n, powers.size)].max()) if n else None,
         }
 
     def _scenario_multi_demod(self) -> Dict[str, Any]:
         """Validate multi-channel demod on synthetic data."""
+        from core.multi_demod import MultiChannelDemod, ChannelConfig
+
         sr = 256_000.0
-        t = np.arange(4096) / sr
-        iq = (0.05 * (np.random.randn(4096) + 1j * np.random.randn(4096))).astype(np.complex64)
-        # Add two tones
-        iq += 0.2 * np.exp(1j * 2 * np.pi * 12_000 * t)
-        iq += 0.2 * np.exp(1j * 2 * np.pi * 30_000 * t)
+        iq = _make_multi_demod_iq(sr)
         cfgs = [
             ChannelConfig(freq_hz=12_000, mode="FM"),
             ChannelConfig(freq_hz=30_000, mode="FM"),
@@ -252,8 +417,10 @@ class RegressionRunner(QThread):
     def _scenario_whisper_available(self) -> Dict[str, Any]:
         """Smoke-test transcriber init and text output (skip if missing)."""
         try:
+            from core.transcriber import Transcriber
+
             tr = Transcriber(model_size="tiny.en")
-            txt = tr.transcribe_audio(np.zeros(8000, dtype=np.float32), sample_rate=16000)
+            txt = tr.transcribe_audio(_WHISPER_SILENCE, sample_rate=16000)
             if not isinstance(txt, str):
                 return {"passed": False, "error": "Whisper returned non-string"}
             if not txt.strip():
@@ -268,7 +435,7 @@ class RegressionRunner(QThread):
 
         if not os.environ.get("OPENAI_API_KEY"):
             return {"passed": True, "skipped": True, "reason": "OPENAI_API_KEY not set"}
-        transcript_idx = TranscriptIndex()
+        transcript_idx = self._new_transcript_index()
         controller = RadioController(
             tune_fn=lambda *a, **k: "tuned",
             scan_fn=lambda *a, **k: "scan",
@@ -277,31 +444,70 @@ class RegressionRunner(QThread):
             search_fn=lambda q, k=5: [{"time": "t", "freq": 100e6, "text": "hello"}],
         )
         agent = RadioOpsAgent(controller=controller, transcript_index=transcript_idx)
-        reply = agent.handle("scan 88 108 0.2 fm")
-        return {"passed": bool(reply.strip()), "reply": reply[:200]}
+        prompt = "scan 88 108 0.2 fm"
+        # Opt-in: a cached reply means the agent itself was not exercised this run.
+        cache = _ReplyCache(self.report_root / "agent_cache.sqlite") if self.use_agent_cache else None
+        reply = cache.get(prompt) if cache else None
+        cached = reply is not None
+        if not cached:
+            reply = agent.handle(prompt)
+            if cache and reply.strip():
+                cache.put(prompt, reply)
+        return {"passed": bool(reply.strip()), "reply": reply[:200], "cached": cached}
 
     # ---------- Runner ----------
 
     def run(self):
         scenarios = [
-            Scenario("synthetic_scan", self._scenario_synthetic_scan, timeout=20.0),
+            Scenario(
+                "synthetic_scan", self._scenario_synthetic_scan, timeout=20.0, group="rtl" if self.use_rtl else None
+            ),
             Scenario("agent_responses", self._scenario_agent, timeout=5.0),
-            Scenario("rtl_probe", self._scenario_rtl_probe, timeout=6.0),
-            Scenario("rtl_scan_power", self._scenario_rtl_scan_power, timeout=12.0),
+            Scenario("rtl_probe", self._scenario_rtl_probe, timeout=6.0, group="rtl"),
+            Scenario("rtl_scan_power", self._scenario_rtl_scan_power, timeout=12.0, group="rtl"),
             Scenario("multi_demod", self._scenario_multi_demod, timeout=5.0),
             Scenario("whisper_available", self._scenario_whisper_available, timeout=5.0),
             Scenario("agent_llm", self._scenario_agent_llm, timeout=6.0),
         ]
-        results = []
+        locks = {sc.group: threading.Lock() for sc in scenarios if sc.group}
+        # A grouped scenario may queue behind its siblings, so its budget includes theirs.
+        budgets: Dict[Optional[str], float] = {}
+        deadlines = []
+
+        def guarded(sc: Scenario) -> Dict[str, Any]:
+            if sc.group is None:
+                return sc.run()
+            with locks[sc.group]:
+                return sc.run()
+
+        def report_done(name: str):
+            return lambda _fut: self._emit(f"Finished {name}")
+
         start = time.time()
+        executor = ThreadPoolExecutor(max_workers=len(scenarios))
+        futures = []
         for sc in scenarios:
             self._emit(f"Running {sc.name} ...")
+            fut = executor.submit(guarded, sc)
+            fut.add_done_callback(report_done(sc.name))
+            futures.append(fut)
+            budget = sc.timeout + (budgets.get(sc.group, 0.0) if sc.group else 0.0)
+            if sc.group:
+                budgets[sc.group] = budget
+            deadlines.append(start + budget + _TIMEOUT_GRACE)
+
+        results = []
+        for sc, fut, deadline in zip(scenarios, futures, deadlines):
             try:
-                res = sc.run()
+                res = fut.result(timeout=max(0.0, deadline - time.time()))
                 res["name"] = sc.name
+            except FutureTimeout:
+                res = {"name": sc.name, "passed": False, "error": f"timed out after {sc.timeout:.0f}s"}
             except Exception as exc:
                 res = {"name": sc.name, "passed": False, "error": str(exc)}
             results.append(res)
+        # Timed-out scenarios cannot be killed; let them finish in the background.
+        executor.shutdown(wait=False)
         duration = time.time() - start
         passed = all(r.get("passed") for r in results)
         report = {
@@ -309,13 +515,11 @@ class RegressionRunner(QThread):
             "passed": passed,
             "duration_sec": duration,
             "timestamp": time.time(),
-            "overrides": self.overrides,
+            "overrides": asdict(self.overrides),
         }
         self._save_overrides(self.overrides)
-        report_path = self.report_root / f"report_{int(time.time())}.json"
         try:
-            report_path.write_text(json.dumps(report, indent=2))
-            report["path"] = str(report_path)
+            report["path"] = str(self._write_report(report))
         except Exception:
             pass
         self._emit("Regression run complete.")
@@ -1,7 +1,14 @@
 """Chat panel for interacting with the LangChain agent."""
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLineEdit, QPushButton, QHBoxLayout
-from PyQt5.QtCore import pyqtSignal
+import time
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QLineEdit, QPushButton, QHBoxLayout
+from PyQt5.QtCore import QTimer, pyqtSignal
+
+# History keeps this many messages; older ones drop off the top.
+MAX_HISTORY_BLOCKS = 5000
+# Enter and a button click landing together count as one send.
+SEND_LOCKOUT_S = 0.05
 
 
 class ChatPanel(QWidget):
@@ -13,10 +20,18 @@ class ChatPanel(QWidget):
         super().__init__(parent)
         layout = QVBoxLayout(self)
 
-        self.history = QTextEdit()
+        self.history = QPlainTextEdit()
         self.history.setReadOnly(True)
+        self.history.setMaximumBlockCount(MAX_HISTORY_BLOCKS)
         layout.addWidget(self.history)
 
+        # Messages arriving in a burst are written in one go on the next tick.
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(30)
+        self._flush_timer.timeout.connect(self._flush)
+
         input_layout = QHBoxLayout()
         self.input = QLineEdit()
         self.input.setPlaceholderText("Ask the agent to tune, scan, summarize…")
@@ -25,16 +40,29 @@ class ChatPanel(QWidget):
         input_layout.addWidget(self.send_btn)
         layout.addLayout(input_layout)
 
+        self._last_emit = 0.0
         self.send_btn.clicked.connect(self._emit_message)
         self.input.returnPressed.connect(self._emit_message)
 
     def _emit_message(self):
+        now = time.monotonic()
+        if now - self._last_emit < SEND_LOCKOUT_S:
+            return
         text = self.input.text().strip()
         if text:
-            self.send_message.emit(text)
+            self._last_emit = now
+            # Clear first so a re-entrant send during a slow reply sees an empty box.
             self.input.clear()
+            self.send_message.emit(text)
 
     def append_message(self, sender: str, text: str):
-        """Append a message to the history."""
-        self.history.append(f"<b>{sender}:</b> {text}")
+        """Queue a message for the history."""
+        self._pending.append(f"<b>{sender}:</b> {text}")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        for html in pending:
+            self.history.appendHtml(html)
 
@@ -3,9 +3,7 @@
 from PyQt5.QtWidgets import (
     QWidget,
     QFormLayout,
-    QHBoxLayout,
     QVBoxLayout,
-    QLabel,
     QLineEdit,
     QComboBox,
     QDoubleSpinBox,
@@ -15,136 +13,124 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 
 
-class DeviceControlPanel(QWidget):
-    """Controls for manual tuning, mode selection, and device settings."""
+MODES = ("FM", "AM", "SSB", "CW")
+# Synthetic first so the UI works out-of-the-box without SDR drivers/hardware.
+SOURCES = ("synthetic", "rtl", "soapy", "file")
+
+# (attribute, widget class, row label, settings) -- applied in order by _build_form.
+_DEVICE_SPECS = (
+    ("freq_input", QDoubleSpinBox, "Frequency (MHz)", dict(range=(0.001, 6000.0), decimals=3, step=0.1, value=100.000)),
+    ("mode_select", QComboBox, "Mode", dict(items=MODES)),
+    ("gain_input", QSpinBox, "Gain (dB/index)", dict(range=(0, 60), value=10)),
+    ("squelch_input", QDoubleSpinBox, "Squelch (dBFS)", dict(range=(-120.0, 0.0), decimals=1, step=1.0, value=-60.0)),
+    ("sample_rate_input", QDoubleSpinBox, "Sample Rate (MS/s)", dict(range=(0.1, 5_000.0), decimals=3, step=0.1, value=2.400)),
+    ("bundle_checkbox", QCheckBox, "Recording", dict(text="Save bundles (SigMF)", checked=True)),
+    ("source_select", QComboBox, "Source", dict(items=SOURCES)),
+    ("file_path", QLineEdit, "IQ File", dict(placeholder="Path to IQ file (for file source)")),
+    ("transcribe_checkbox", QCheckBox, "AI", dict(text="Transcribe voice (Whisper)", checked=False)),
+)
+
+_SCAN_SPECS = (
+    ("scan_checkbox", QCheckBox, "Mode", dict(text="Enable Scan Mode")),
+    ("start_freq", QDoubleSpinBox, "Start (MHz)", dict(range=(0.001, 6000.0), decimals=3, value=100.000)),
+    ("stop_freq", QDoubleSpinBox, "Stop (MHz)", dict(range=(0.001, 6000.0), decimals=3, value=101.000)),
+    ("step_freq", QDoubleSpinBox, "Step (MHz)", dict(range=(0.001, 1000.0), decimals=3, step=0.01, value=0.200)),
+    ("dwell_time", QDoubleSpinBox, "Dwell (s)", dict(range=(0.0, 10.0), decimals=2, step=0.25, value=0.25)),
+    ("hold_time", QDoubleSpinBox, "Hold after Tx (s)", dict(range=(0.0, 10.0), decimals=2, step=0.25, value=0.50)),
+)
+
+
+# Signal that marks a panel's cached values() stale, per widget class.
+_CHANGE_SIGNALS = {
+    QDoubleSpinBox: "valueChanged",
+    QSpinBox: "valueChanged",
+    QComboBox: "currentIndexChanged",
+    QCheckBox: "toggled",
+    QLineEdit: "textChanged",
+}
+
+
+def _build_form(owner: QWidget, specs) -> None:
+    """Create the spec'd widgets as attributes of ``owner`` inside a right-aligned form."""
+    layout = QFormLayout()
+    layout.setLabelAlignment(Qt.AlignRight)
+    for name, cls, label, opts in specs:
+        widget = cls(opts["text"]) if "text" in opts else cls()
+        if "range" in opts:
+            widget.setRange(*opts["range"])
+        if "decimals" in opts:
+            widget.setDecimals(opts["decimals"])
+        if "step" in opts:
+            widget.setSingleStep(opts["step"])
+        if "value" in opts:
+            widget.setValue(opts["value"])
+        if "items" in opts:
+            widget.addItems(opts["items"])
+        if "checked" in opts:
+            widget.setChecked(opts["checked"])
+        if "placeholder" in opts:
+            widget.setPlaceholderText(opts["placeholder"])
+        setattr(owner, name, widget)
+        getattr(widget, _CHANGE_SIGNALS[cls]).connect(owner._invalidate)
+        layout.addRow(label, widget)
+    wrapper = QVBoxLayout(owner)
+    wrapper.addLayout(layout)
+    wrapper.addStretch(1)
+
+
+class _FormPanel(QWidget):
+    """Form built from ``_SPECS``; ``values()`` results are cached until a control changes."""
+
+    _SPECS = ()
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        layout = QFormLayout()
-        layout.setLabelAlignment(Qt.AlignRight)
-
-        self.freq_input = QDoubleSpinBox()
-        self.freq_input.setRange(0.001, 6000.0)
-        self.freq_input.setDecimals(3)
-        self.freq_input.setSingleStep(0.1)
-        self.freq_input.setValue(100.000)
-        layout.addRow(QLabel("Frequency (MHz)"), self.freq_input)
-
-        self.mode_select = QComboBox()
-        self.mode_select.addItems(["FM", "AM", "SSB", "CW"])
-        layout.addRow(QLabel("Mode"), self.mode_select)
-
-        self.gain_input = QSpinBox()
-        self.gain_input.setRange(0, 60)
-        self.gain_input.setValue(10)
-        layout.addRow(QLabel("Gain (dB/index)"), self.gain_input)
-
-        self.squelch_input = QDoubleSpinBox()
-        self.squelch_input.setRange(-120.0, 0.0)
-        self.squelch_input.setDecimals(1)
-        self.squelch_input.setSingleStep(1.0)
-        self.squelch_input.setValue(-60.0)
-        layout.addRow(QLabel("Squelch (dBFS)"), self.squelch_input)
-
-        self.sample_rate_input = QDoubleSpinBox()
-        self.sample_rate_input.setRange(0.1, 5_000.0)
-        self.sample_rate_input.setDecimals(3)
-        self.sample_rate_input.setSingleStep(0.1)
-        self.sample_rate_input.setValue(2.400)
-        layout.addRow(QLabel("Sample Rate (MS/s)"), self.sample_rate_input)
-
-        self.bundle_checkbox = QCheckBox("Save bundles (SigMF)")
-        self.bundle_checkbox.setChecked(True)
-        layout.addRow(QLabel("Recording"), self.bundle_checkbox)
-
-        self.source_select = QComboBox()
-        # Default to synthetic so the UI works out-of-the-box without SDR drivers/hardware.
-        self.source_select.addItems(["synthetic", "rtl", "soapy", "file"])
-        layout.addRow(QLabel("Source"), self.source_select)
-
-        self.file_path = QLineEdit()
-        self.file_path.setPlaceholderText("Path to IQ file (for file source)")
-        layout.addRow(QLabel("IQ File"), self.file_path)
-
-        self.transcribe_checkbox = QCheckBox("Transcribe voice (Whisper)")
-        self.transcribe_checkbox.setChecked(False)
-        layout.addRow(QLabel("AI"), self.transcribe_checkbox)
-
-        wrapper = QVBoxLayout(self)
-        wrapper.addLayout(layout)
-        wrapper.addStretch(1)
+        self._cache = None
+        _build_form(self, self._SPECS)
+
+    def _invalidate(self, *_args) -> None:
+        self._cache = None
+
+
+class DeviceControlPanel(_FormPanel):
+    """Controls for manual tuning, mode selection, and device settings."""
+
+    _SPECS = _DEVICE_SPECS
+    MODES = MODES
+    SOURCES = SOURCES
 
     def values(self) -> dict:
-        """Return current control values as a dict."""
-        return {
-            "frequency_mhz": float(self.freq_input.value()),
-            "mode": str(self.mode_select.currentText()),
-            "gain": int(self.gain_input.value()),
-            "squelch_db": float(self.squelch_input.value()),
-            "sample_rate_hz": float(self.sample_rate_input.value()) * 1e6,
-            "source": str(self.source_select.currentText()),
-            "file_path": str(self.file_path.text()).strip(),
-            "save_bundles": self.bundle_checkbox.isChecked(),
-            "enable_transcription": self.transcribe_checkbox.isChecked(),
-        }
-
-
-class ScanControlPanel(QWidget):
+        """Return current control values as a dict (cached until a control changes)."""
+        if self._cache is None:
+            self._cache = {
+                "frequency_mhz": float(self.freq_input.value()),
+                "mode": str(self.mode_select.currentText()),
+                "gain": int(self.gain_input.value()),
+                "squelch_db": float(self.squelch_input.value()),
+                "sample_rate_hz": float(self.sample_rate_input.value()) * 1e6,
+                "source": str(self.source_select.currentText()),
+                "file_path": str(self.file_path.text()).strip(),
+                "save_bundles": self.bundle_checkbox.isChecked(),
+                "enable_transcription": self.transcribe_checkbox.isChecked(),
+            }
+        return dict(self._cache)
+
+
+class ScanControlPanel(_FormPanel):
     """Controls for scan mode configuration."""
 
-    def __init__(self, parent=None) -> None:
-        super().__init__(parent)
-        layout = QFormLayout()
-        layout.setLabelAlignment(Qt.AlignRight)
-
-        self.scan_checkbox = QCheckBox("Enable Scan Mode")
-        layout.addRow(QLabel("Mode"), self.scan_checkbox)
-
-        self.start_freq = QDoubleSpinBox()
-        self.start_freq.setRange(0.001, 6000.0)
-        self.start_freq.setDecimals(3)
-        self.start_freq.setValue(100.000)
-        layout.addRow(QLabel("Start (MHz)"), self.start_freq)
-
-        self.stop_freq = QDoubleSpinBox()
-        self.stop_freq.setRange(0.001, 6000.0)
-        self.stop_freq.setDecimals(3)
-        self.stop_freq.setValue(101.000)
-        layout.addRow(QLabel("Stop (MHz)"), self.stop_freq)
-
-        self.step_freq = QDoubleSpinBox()
-        self.step_freq.setRange(0.001, 1000.0)
-        self.step_freq.setDecimals(3)
-        self.step_freq.setSingleStep(0.01)
-        self.step_freq.setValue(0.200)
-        layout.addRow(QLabel("Step (MHz)"), self.step_freq)
-
-        self.dwell_time = QDoubleSpinBox()
-        self.dwell_time.setRange(0.0, 10.0)
-        self.dwell_time.setDecimals(2)
-        self.dwell_time.setSingleStep(0.25)
-        self.dwell_time.setValue(0.25)
-        layout.addRow(QLabel("Dwell (s)"), self.dwell_time)
-
-        self.hold_time = QDoubleSpinBox()
-        self.hold_time.setRange(0.0, 10.0)
-        self.hold_time.setDecimals(2)
-        self.hold_time.setSingleStep(0.25)
-        self.hold_time.setValue(0.50)
-        layout.addRow(QLabel("Hold after Tx (s)"), self.hold_time)
-
-        wrapper = QVBoxLayout(self)
-        wrapper.addLayout(layout)
-        wrapper.addStretch(1)
+    _SPECS = _SCAN_SPECS
 
     def values(self) -> dict:
-        """Return scan configuration as a dict."""
-        return {
-            "scan_mode": self.scan_checkbox.isChecked(),
-            "start_mhz": float(self.start_freq.value()),
-            "stop_mhz": float(self.stop_freq.value()),
-            "step_mhz": float(self.step_freq.value()),
-            "dwell_seconds": float(self.dwell_time.value()),
-            "hold_seconds": float(self.hold_time.value()),
-        }
+        """Return scan configuration as a dict (cached until a control changes)."""
+        if self._cache is None:
+            self._cache = {
+                "scan_mode": self.scan_checkbox.isChecked(),
+                "start_mhz": float(self.start_freq.value()),
+                "stop_mhz": float(self.stop_freq.value()),
+                "step_mhz": float(self.step_freq.value()),
+                "dwell_seconds": float(self.dwell_time.value()),
+                "hold_seconds": float(self.hold_time.value()),
+            }
+        return dict(self._cache)
 
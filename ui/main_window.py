@@ -23,12 +23,15 @@ from PyQt5.QtWidgets import (
     QScrollArea,
     QToolButton,
 )
-from PyQt5.QtGui import QPalette, QColor, QFont, QPixmap
-from PyQt5.QtCore import pyqtSlot, Qt, QSettings
+from PyQt5.QtGui import QPalette, QColor, QFont, QPainter, QPixmap, QPixmapCache, QTextCursor, QDesktopServices
+from PyQt5.QtCore import pyqtSlot, Qt, QSettings, QTimer, QUrl
 import numpy as np
 import math
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
-from collections import deque
 
 from core.scanner import ScannerThread
 from core.agent import RadioOpsAgent, RadioController
@@ -37,23 +40,170 @@ from core.logger import EventLogger
 from core.audio_out import AudioOutput
 from core.plugins import load_plugins
 from ui.plot_widgets import SpectrumWidget, WaterfallWidget
-from ui.control_panels import DeviceControlPanel, ScanControlPanel
+from ui.control_panels import DeviceControlPanel, ScanControlPanel, MODES, SOURCES, _CHANGE_SIGNALS
 from ui.chat_panel import ChatPanel
 from ui.multi_channel_tab import MultiChannelTab
 
+# Display cadence for spectrum/waterfall redraws (~25 FPS); faster frames are dropped.
+SPECTRUM_FRAME_MS = 40
+# Event lines are written to the log in one batch per tick.
+LOG_FLUSH_MS = 100
+MAX_LOG_BLOCKS = 5000
+INSIGHT_SLOTS = 8
+# mode_select is filled from MODES once, so its row for a mode name never changes.
+_MODE_INDEX = {m.upper(): i for i, m in enumerate(MODES)}
+# The chat panel shows a repeated (freq, text) event at most once per window.
+CHAT_DEDUP_SLOTS = 32
+CHAT_DEDUP_S = 2.0
+# Transcript search results kept per (query, k) until the index changes.
+SEARCH_CACHE_SLOTS = 64
+# EventLogger.log_event always sets these keys.
+_EVENT_ROW = itemgetter("time", "freq", "text")
+# Persisted scan settings and their defaults, read in one pass at startup.
+_SETTINGS_DEFAULTS = {
+    "scan_mode": False,
+    "start_mhz": 100.0,
+    "stop_mhz": 101.0,
+    "step_mhz": 0.2,
+    "min_event_s": 1.0,
+    "auto_start": False,
+    "hunt_mode": False,
+}
+# Audio meter repaint cadence; levels in between are peak-held.
+AUDIO_METER_MS = 33
+# Audio-reactive frame glow; the green channel is bucketed so restyles are rare.
+_GLOW_QSS = "border: 2px solid rgba(255, {}, 79, 0.65); border-radius: 8px; background-color: #0f131d;"
+
+
+# Window-level theme. Plugin tabs rely on these type/objectName rules, so they stay
+# on the main window; one-off widget styling is set on the widget itself.
+_THEME_QSS = """
+QWidget { color: #f5f7fb; background-color: #0a0c14; }
+QTextEdit, QLineEdit { background-color: #0f131d; border: 1px solid #1d2230; border-radius: 10px; }
+QComboBox, QSpinBox, QDoubleSpinBox { background-color: #0f131d; border: 1px solid #1d2230; border-radius: 10px; padding: 3px; }
+QPushButton { background-color: #f5a524; border: none; border-radius: 10px; padding: 9px 12px; color: #0a0c14; font-weight: 800; }
+QPushButton:disabled { background-color: #2b303f; color: #a9a9be; }
+QPushButton:hover:!disabled { background-color: #ffc75f; }
+QTextEdit#insights { border: 1px solid #1d2230; border-radius: 14px; padding: 12px; background-color: #101724; }
+QTextEdit#notes { border: 1px solid #1d2230; border-radius: 14px; padding: 12px; background-color: #101724; }
+QLabel#sectionTitle { color: #ffd489; font-weight: 900; }
+QTabWidget::pane { border: 1px solid #1d2230; border-radius: 14px; }
+QTabBar::tab { background: #0f131d; border: 1px solid #1d2230; padding: 9px 14px; border-top-left-radius: 12px; border-top-right-radius: 12px; margin-right: 4px; }
+QTabBar::tab:selected { background: #141a26; border-bottom-color: #141a26; }
+"""
+
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Set several widgets at once without firing their change handlers."""
+    for w in widgets:
+        w.blockSignals(True)
+    try:
+        yield
+    finally:
+        for w in widgets:
+            w.blockSignals(False)
+
+
+def _scaled_pixmap(path, height=None, width=None) -> QPixmap:
+    """Smooth-scaled pixmap of ``path``, decoded and scaled once per size."""
+    key = f"logo:{path}:{height}x{width}"
+    pix = QPixmapCache.find(key)
+    if pix is None:
+        pix = QPixmap(str(path))
+        if height:
+            pix = pix.scaledToHeight(height, Qt.SmoothTransformation)
+        elif width:
+            pix = pix.scaledToWidth(width, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pix)
+    return pix
+
+
+class _SettingsCache:
+    """QSettings front that reads each key once and writes back only changed keys."""
+
+    def __init__(self, qsettings: QSettings) -> None:
+        self._q = qsettings
+        self._vals: dict = {}
+        self._dirty: set = set()
+
+    def value(self, key: str, default=None, type=None):
+        if key not in self._vals:
+            if type is None:
+                self._vals[key] = self._q.value(key, default)
+            else:
+                self._vals[key] = self._q.value(key, default, type=type)
+        return self._vals[key]
+
+    def setValue(self, key: str, value) -> None:
+        if key in self._vals and self._vals[key] == value:
+            return
+        self._vals[key] = value
+        self._dirty.add(key)
+
+    def sync(self) -> None:
+        """Write dirty keys through to the backing store."""
+        if not self._dirty:
+            return
+        for key in self._dirty:
+            self._q.setValue(key, self._vals[key])
+        self._dirty.clear()
+        self._q.sync()
+
+
+class _BackgroundWidget(QWidget):
+    """Central widget that paints an optional background image.
+
+    The image is decoded once and rescaled only on resize, so a repaint is a
+    single blit instead of a stylesheet image lookup per child widget.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._bg_pix = None
+        self._bg_scaled = None
+
+    def set_background(self, path) -> None:
+        pix = QPixmap(str(path))
+        self._bg_pix = None if pix.isNull() else pix
+        self._rescale()
+        self.update()
+
+    def _rescale(self) -> None:
+        if self._bg_pix is not None and not self.size().isEmpty():
+            self._bg_scaled = self._bg_pix.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        else:
+            self._bg_scaled = None
+
+    def resizeEvent(self, event):
+        self._rescale()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), QColor("#0a0c14"))
+        if self._bg_scaled is not None:
+            x = (self.width() - self._bg_scaled.width()) // 2
+            y = (self.height() - self._bg_scaled.height()) // 2
+            painter.drawPixmap(x, y, self._bg_scaled)
+
 
 class SDRMainWindow(QMainWindow):
     """Main GUI window for AstroTrace."""
 
+    _TITLE_FONT = None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AstroTrace")
         self.resize(1200, 780)
         self._apply_theme()
-        self.settings = QSettings("AstroTrace", "AstroTraceApp")
+        self.settings = _SettingsCache(QSettings("AstroTrace", "AstroTraceApp"))
         self._logo_path, self._bg_path = self._find_brand_assets()
+        # Resolve relative to repo root (astrotrace/), not the current working directory.
+        self._bundle_dir = (Path(__file__).resolve().parent.parent / "runs").resolve()
 
-        central_widget = QWidget(self)
+        central_widget = _BackgroundWidget(self)
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(10, 8, 10, 10)
@@ -91,7 +241,34 @@ class SDRMainWindow(QMainWindow):
         self.agent_controller = self._build_controller()
         self.agent = RadioOpsAgent(controller=self.agent_controller, transcript_index=self.transcript_index)
         self.audio_output = AudioOutput()
-        self._insight_buffer = deque(maxlen=8)
+        # Fixed ring of recent insights; _insight_idx is the next slot to write.
+        self._insight_buffer = [""] * INSIGHT_SLOTS
+        self._insight_idx = 0
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._now_playing = None
+        self._chat_dedup: OrderedDict = OrderedDict()
+        self._log_view_state = None
+        self._search_text = None
+        self._search_cache: OrderedDict = OrderedDict()
+        self._device_key = None
+        self._device_text = ("", "")
+        self._audio_peak = 0.0
+        self._audio_pct = None
+        self._glow_hot = None
+        self._audio_timer = QTimer(self)
+        self._audio_timer.timeout.connect(self._render_audio_level)
+        # Spectrum frames are coalesced: only the newest one is drawn per display tick.
+        self._pending_spectrum = None
+        self._spectrum_timer = QTimer(self)
+        self._spectrum_timer.setSingleShot(True)
+        self._spectrum_timer.timeout.connect(self._flush_spectrum)
+        # _parse_ui_params() is cached until one of its controls changes.
+        self._params_cache = None
+        for w in self._param_widgets():
+            getattr(w, _CHANGE_SIGNALS[type(w)]).connect(self._invalidate_params)
         self._load_settings()
 
         # Signals
@@ -99,14 +276,12 @@ class SDRMainWindow(QMainWindow):
         self.stop_button.clicked.connect(self.stop_pressed)
         self.open_bundles_button.clicked.connect(self.open_bundles)
         self.chat_panel.send_message.connect(self.handle_chat)
-        self.search_btn.clicked.connect(self._run_search)
-        self.search_input.returnPressed.connect(self._run_search)
         self.refresh_log_button.clicked.connect(self._refresh_log_view)
         # Start audio output if available
         if self.audio_output.available:
             self.audio_output.start()
         else:
-            self.log_output.append("Audio output backend not available (install sounddevice or pyaudio).")
+            self.append_log("Audio output backend not available (install sounddevice or pyaudio).")
 
         # Seed notes with helpful guidance
         self._set_agent_notes(
@@ -120,10 +295,12 @@ class SDRMainWindow(QMainWindow):
         )
         self._push_ai_insight("Copilot ready. Start on synthetic to see activity immediately.")
 
-        # Load plugins (Beacon, Vision, Anomaly, etc.)
-        load_plugins(ui=self, tab_widget=self.plugin_tabs)
+        # Plugins (Beacon, Vision, Anomaly, etc.) and auto-start run from the event
+        # loop so the window can paint before they initialize.
+        QTimer.singleShot(0, self._finish_startup)
 
-        # Auto-start if requested
+    def _finish_startup(self):
+        load_plugins(ui=self, tab_widget=self.plugin_tabs)
         if getattr(self, "_auto_start_flag", False):
             self.start_pressed()
 
@@ -138,6 +315,13 @@ class SDRMainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        view_menu = menubar.addMenu("View")
+        gl_action = QAction("OpenGL spectrum (applies on restart)", self)
+        gl_action.setCheckable(True)
+        gl_action.setChecked(self.settings.value("use_opengl", False, type=bool))
+        gl_action.toggled.connect(lambda on: self.settings.setValue("use_opengl", on))
+        view_menu.addAction(gl_action)
+
         help_menu = menubar.addMenu("Help")
         about_action = QAction("About", self)
         about_action.triggered.connect(self._show_about)
@@ -162,6 +346,8 @@ class SDRMainWindow(QMainWindow):
         }
         for name in self._presets:
             self.preset_combo.addItem(name)
+        # Row of each preset in preset_combo (row 0 is the "Select…" prompt).
+        self._preset_index = {name: i for i, name in enumerate(self._presets, start=1)}
         self.preset_combo.currentTextChanged.connect(self._apply_preset)
         toolbar.addWidget(label)
         toolbar.addWidget(self.preset_combo)
@@ -190,23 +376,7 @@ class SDRMainWindow(QMainWindow):
         palette.setColor(QPalette.Highlight, QColor("#ffb94f"))
         palette.setColor(QPalette.HighlightedText, QColor("#0a0c14"))
         self.setPalette(palette)
-        self.setStyleSheet(
-            """
-            QWidget { color: #f5f7fb; background-color: #0a0c14; }
-            QTextEdit, QLineEdit { background-color: #0f131d; border: 1px solid #1d2230; border-radius: 10px; }
-            QComboBox, QSpinBox, QDoubleSpinBox { background-color: #0f131d; border: 1px solid #1d2230; border-radius: 10px; padding: 3px; }
-            QPushButton { background-color: #f5a524; border: none; border-radius: 10px; padding: 9px 12px; color: #0a0c14; font-weight: 800; }
-            QPushButton:disabled { background-color: #2b303f; color: #a9a9be; }
-            QPushButton:hover:!disabled { background-color: #ffc75f; }
-            QGroupBox, QLabel { color: #f5f7fb; }
-            QTextEdit#insights { border: 1px solid #1d2230; border-radius: 14px; padding: 12px; background-color: #101724; }
-            QTextEdit#notes { border: 1px solid #1d2230; border-radius: 14px; padding: 12px; background-color: #101724; }
-            QLabel#sectionTitle { color: #ffd489; font-weight: 900; }
-            QTabWidget::pane { border: 1px solid #1d2230; border-radius: 14px; }
-            QTabBar::tab { background: #0f131d; border: 1px solid #1d2230; padding: 9px 14px; border-top-left-radius: 12px; border-top-right-radius: 12px; margin-right: 4px; }
-            QTabBar::tab:selected { background: #141a26; border-bottom-color: #141a26; }
-            """
-        )
+        self.setStyleSheet(_THEME_QSS)
 
     def _find_brand_assets(self):
         """Locate optional logo/background assets if the user added them."""
@@ -229,21 +399,22 @@ class SDRMainWindow(QMainWindow):
         bg = next((p for p in candidates_bg if p.exists()), None)
         return logo, bg
 
-    def _apply_background(self, widget: QWidget):
-        """Apply a faded background image if available."""
+    def _apply_background(self, widget: _BackgroundWidget):
+        """Apply a background image if available."""
         if self._bg_path:
-            widget.setStyleSheet(
-                widget.styleSheet()
-                + f"""
-                QWidget {{
-                    background-image: url("{self._bg_path}");
-                    background-repeat: no-repeat;
-                    background-position: center;
-                    background-attachment: fixed;
-                    background-color: #0a0c14;
-                }}
-                """
-            )
+            widget.set_background(self._bg_path)
+            # Plain containers (exact class match) and labels let the painted image show through.
+            widget.setStyleSheet(".QWidget, .QSplitter, QLabel, QCheckBox { background: transparent; }")
+
+    @classmethod
+    def _title_font(cls) -> QFont:
+        """Bold 12 pt title font, built once and shared."""
+        if cls._TITLE_FONT is None:
+            font = QFont()
+            font.setPointSize(12)
+            font.setBold(True)
+            cls._TITLE_FONT = font
+        return cls._TITLE_FONT
 
     def _build_header(self) -> QWidget:
         """Create a compact single-line header."""
@@ -253,17 +424,14 @@ class SDRMainWindow(QMainWindow):
         layout.setContentsMargins(4, 0, 4, 0)
         layout.setSpacing(10)
 
-        if self._logo_path and Path(self._logo_path).exists():
+        if self._logo_path:
             logo_lbl = QLabel()
-            pix = QPixmap(str(self._logo_path)).scaledToHeight(42, Qt.SmoothTransformation)
+            pix = _scaled_pixmap(self._logo_path, height=42)
             logo_lbl.setPixmap(pix)
             layout.addWidget(logo_lbl)
 
         title = QLabel("AstroTrace — Signal Intelligence for SDR + AI Copilot")
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._title_font())
 
         layout.addWidget(title)
         layout.addStretch(1)
@@ -343,12 +511,17 @@ class SDRMainWindow(QMainWindow):
         audio_row.addWidget(self.audio_label)
         layout.addLayout(audio_row)
 
-        self.spectrum_widget = SpectrumWidget()
+        self.spectrum_widget = SpectrumWidget(use_opengl=self.settings.value("use_opengl", False, type=bool))
         self.spectrum_widget.setObjectName("spectrum")
         layout.addWidget(self.spectrum_widget, stretch=1)
         self.waterfall_widget = WaterfallWidget()
         self.waterfall_widget.setObjectName("waterfall")
         layout.addWidget(self.waterfall_widget, stretch=2)
+        # Both plot viewports paint every pixel, so Qt can skip erasing them first.
+        for view in (self.spectrum_widget.viewport(), self.waterfall_widget.image_view.ui.graphicsView.viewport()):
+            view.setAttribute(Qt.WA_OpaquePaintEvent, True)
+            view.setAttribute(Qt.WA_NoSystemBackground, True)
+            view.setAutoFillBackground(False)
         return container
 
     def _build_controls_widget(self) -> QWidget:
@@ -367,7 +540,7 @@ class SDRMainWindow(QMainWindow):
         row1.addWidget(self._labeled("Frequency (MHz)", self.freq_input))
 
         self.mode_select = QComboBox()
-        self.mode_select.addItems(["FM", "AM", "SSB", "CW"])
+        self.mode_select.addItems(MODES)
         row1.addWidget(self._labeled("Mode", self.mode_select))
 
         self.gain_input = QSpinBox()
@@ -398,7 +571,7 @@ class SDRMainWindow(QMainWindow):
 
         row3 = QHBoxLayout()
         self.source_select = QComboBox()
-        self.source_select.addItems(["synthetic", "rtl", "soapy", "file"])
+        self.source_select.addItems(SOURCES)
         row3.addWidget(self._labeled("Source", self.source_select))
 
         self.transcribe_cb = QCheckBox("Transcribe (Whisper)")
@@ -510,6 +683,7 @@ class SDRMainWindow(QMainWindow):
         log_layout.addLayout(log_controls)
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.document().setMaximumBlockCount(MAX_LOG_BLOCKS)
         log_layout.addWidget(self.log_output)
         splitter.addWidget(log_container)
 
@@ -544,10 +718,49 @@ class SDRMainWindow(QMainWindow):
         copilot_layout.addWidget(self.chat_panel, stretch=1)
         tabs.addTab(copilot_tab, "Copilot")
 
+        # Channels/Insights/Search start as placeholders and are built on first view.
+        self.multi_tab = None
+        self.ai_insights = None
+        self.search_input = self.search_btn = self.search_results = None
+        self._lazy_tabs = {
+            "Channels": self._build_channels_tab,
+            "Insights": self._build_insights_tab,
+            "Search": self._build_search_tab,
+        }
+        for title in self._lazy_tabs:
+            tabs.addTab(QWidget(), title)
+        tabs.currentChanged.connect(self._maybe_build_tab)
+
+        self.plugin_tabs = tabs
+
+        splitter.addWidget(tabs)
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 3)
+        splitter.setSizes([240, 800])
+        return splitter
+
+    def _maybe_build_tab(self, index: int):
+        tabs = self.plugin_tabs
+        title = tabs.tabText(index)
+        builder = self._lazy_tabs.pop(title, None)
+        if builder is None:
+            return
+        placeholder = tabs.widget(index)
+        tabs.blockSignals(True)
+        try:
+            tabs.removeTab(index)
+            tabs.insertTab(index, builder(), title)
+            tabs.setCurrentIndex(index)
+        finally:
+            tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _build_channels_tab(self) -> QWidget:
         self.multi_tab = MultiChannelTab()
         self.multi_tab.channels_changed.connect(self._channels_changed)
-        tabs.addTab(self.multi_tab, "Channels")
+        return self.multi_tab
 
+    def _build_insights_tab(self) -> QWidget:
         insights_tab = QWidget()
         insights_layout = QVBoxLayout(insights_tab)
         insights_title = QLabel("What AstroTrace noticed")
@@ -558,8 +771,10 @@ class SDRMainWindow(QMainWindow):
         self.ai_insights.setReadOnly(True)
         self.ai_insights.setPlaceholderText("Discoveries, hints, and summaries will collect here.")
         insights_layout.addWidget(self.ai_insights)
-        tabs.addTab(insights_tab, "Insights")
+        self._render_insights()
+        return insights_tab
 
+    def _build_search_tab(self) -> QWidget:
         search_tab = QWidget()
         search_layout = QVBoxLayout(search_tab)
         search_title = QLabel("Search transcripts")
@@ -576,15 +791,9 @@ class SDRMainWindow(QMainWindow):
         self.search_results.setReadOnly(True)
         self.search_results.setPlaceholderText("Results will appear here.")
         search_layout.addWidget(self.search_results, stretch=1)
-        tabs.addTab(search_tab, "Search")
-
-        self.plugin_tabs = tabs
-
-        splitter.addWidget(tabs)
-        splitter.setStretchFactor(0, 1)
-        splitter.setStretchFactor(1, 3)
-        splitter.setSizes([240, 800])
-        return splitter
+        self.search_btn.clicked.connect(self._run_search)
+        self.search_input.returnPressed.connect(self._run_search)
+        return search_tab
 
     def _build_controller(self) -> RadioController:
         return RadioController(
@@ -595,29 +804,58 @@ class SDRMainWindow(QMainWindow):
             search_fn=self._agent_search,
         )
 
+    def _param_widgets(self):
+        return (
+            self.freq_input,
+            self.mode_select,
+            self.gain_input,
+            self.squelch_input,
+            self.sample_rate_input,
+            self.source_select,
+            self.file_path,
+            self.save_bundles_cb,
+            self.transcribe_cb,
+            self.scan_checkbox,
+            self.start_freq,
+            self.stop_freq,
+            self.step_freq,
+            self.dwell_time,
+            self.hold_time,
+            self.min_event_duration,
+            self.hunt_mode_cb,
+        )
+
+    def _invalidate_params(self, *_args):
+        self._params_cache = None
+
     def _parse_ui_params(self):
-        device = {
-            "frequency_mhz": float(self.freq_input.value()),
-            "mode": str(self.mode_select.currentText()),
-            "gain": int(self.gain_input.value()),
-            "squelch_db": float(self.squelch_input.value()),
-            "sample_rate_hz": float(self.sample_rate_input.value()) * 1e6,
-            "source": str(self.source_select.currentText()),
-            "file_path": str(self.file_path.text()).strip(),
-            "save_bundles": self.save_bundles_cb.isChecked(),
-            "enable_transcription": self.transcribe_cb.isChecked(),
-        }
-        scan = {
-            "scan_mode": self.scan_checkbox.isChecked(),
-            "start_mhz": float(self.start_freq.value()),
-            "stop_mhz": float(self.stop_freq.value()),
-            "step_mhz": float(self.step_freq.value()),
-            "dwell_seconds": float(self.dwell_time.value()),
-            "hold_seconds": float(self.hold_time.value()),
-            "min_event_seconds": float(self.min_event_duration.value()),
-            "hunt_mode": bool(self.hunt_mode_cb.isChecked()),
-        }
-        return device, scan
+        """Return (device, scan) dicts; fresh copies of values cached until a control changes."""
+        if self._params_cache is None:
+            device = {
+                "frequency_mhz": self.freq_input.value(),
+                "mode": self.mode_select.currentText(),
+                "gain": self.gain_input.value(),
+                "squelch_db": self.squelch_input.value(),
+                "sample_rate_hz": self.sample_rate_input.value() * 1e6,
+                "source": self.source_select.currentText(),
+                "file_path": self.file_path.text().strip(),
+                "save_bundles": self.save_bundles_cb.isChecked(),
+                "enable_transcription": self.transcribe_cb.isChecked(),
+            }
+            scan = {
+                "scan_mode": self.scan_checkbox.isChecked(),
+                "start_mhz": self.start_freq.value(),
+                "stop_mhz": self.stop_freq.value(),
+                "step_mhz": self.step_freq.value(),
+                "dwell_seconds": self.dwell_time.value(),
+                "hold_seconds": self.hold_time.value(),
+                "min_event_seconds": self.min_event_duration.value(),
+                "hunt_mode": self.hunt_mode_cb.isChecked(),
+            }
+            self._params_cache = (device, scan)
+        # Callers add/adjust keys (multi_channels, hunt-mode tweaks), so hand out copies.
+        device, scan = self._params_cache
+        return dict(device), dict(scan)
 
     def _start_scanner(self, device: dict, scan: dict):
         scan_mode = scan["scan_mode"]
@@ -652,19 +890,20 @@ class SDRMainWindow(QMainWindow):
             save_bundles=device["save_bundles"],
             multi_channels=device.get("multi_channels") or [],
         )
-        self.scanner_thread.signal_update.connect(self.update_spectrum)
-        self.scanner_thread.signal_event.connect(self.handle_event)
-        self.scanner_thread.finished.connect(self.scanner_finished)
-        self.scanner_thread.audio_level.connect(self._update_audio_level)
-        self.scanner_thread.device_info.connect(self._update_device_info)
-        self.scanner_thread.now_playing.connect(self._update_now_playing_freqmode)
-        try:
-            self.scanner_thread.audio_frame.connect(self._play_audio)
-        except Exception:
-            pass
-        self.log_output.append(f"**Started {'Scanning' if scan_mode else 'Receiving'}**")
+        # Everything is emitted from the scanner thread; UI slots must never run there.
+        queued = Qt.QueuedConnection
+        self.scanner_thread.signal_update.connect(self.update_spectrum, queued | Qt.UniqueConnection)
+        self.scanner_thread.signal_event.connect(self.handle_event, queued)
+        self.scanner_thread.finished.connect(self.scanner_finished, queued)
+        self.scanner_thread.audio_level.connect(self._update_audio_level, queued)
+        self.scanner_thread.device_info.connect(self._update_device_info, queued)
+        self.scanner_thread.now_playing.connect(self._update_now_playing_freqmode, queued)
+        if hasattr(self.scanner_thread, "audio_frame"):
+            self.scanner_thread.audio_frame.connect(self._play_audio, queued)
+        self.append_log(f"**Started {'Scanning' if scan_mode else 'Receiving'}**")
         self.status_label.setText("Connecting to device…")
         self.scanner_thread.start()
+        self._audio_timer.start(AUDIO_METER_MS)
 
     @pyqtSlot()
     def start_pressed(self):
@@ -673,7 +912,7 @@ class SDRMainWindow(QMainWindow):
             return
         device, scan = self._parse_ui_params()
         if scan["scan_mode"] and scan["step_mhz"] <= 0:
-            self.log_output.append("Step must be > 0 for scan mode.")
+            self.append_log("Step must be > 0 for scan mode.")
             return
         device["multi_channels"] = getattr(self, "_multi_cfg", [])
         self._start_scanner(device, scan)
@@ -687,12 +926,17 @@ class SDRMainWindow(QMainWindow):
 
     @pyqtSlot(object)
     def update_spectrum(self, spectrum_data):
+        self._pending_spectrum = spectrum_data
+        if not self._spectrum_timer.isActive():
+            self._spectrum_timer.start(SPECTRUM_FRAME_MS)
+
+    def _flush_spectrum(self):
+        spectrum_data, self._pending_spectrum = self._pending_spectrum, None
+        if spectrum_data is None:
+            return
         freq_axis, power = spectrum_data
         self.spectrum_widget.update_spectrum(freq_axis, power)
-        try:
-            self.waterfall_widget.add_line(np.asarray(power))
-        except Exception:
-            pass
+        self.waterfall_widget.add_line(power)
 
     @pyqtSlot(object)
     def handle_event(self, event):
@@ -703,20 +947,53 @@ class SDRMainWindow(QMainWindow):
             freq_mhz = freq_hz / 1e6
             log_line = f"{ts} - {freq_mhz:.3f} MHz: {text}"
             self._update_now_playing(freq_mhz, text)
+            self._update_log_count(EventLogger.event_count())
+            repeat = self._seen_recently((round(freq_mhz, 3), text))
         else:
             log_line = str(event)
             if "SDR init failed" in log_line:
                 self.status_label.setText(log_line)
-        self.log_output.append(log_line)
-        self.chat_panel.append_message("Event", log_line)
-        try:
-            self._update_log_count(len(EventLogger.recent_events(200)))
-        except Exception:
-            pass
+            repeat = False
+        self.append_log(log_line)
+        if not repeat:
+            self.chat_panel.append_message("Event", log_line)
+
+    def _seen_recently(self, key) -> bool:
+        """True if ``key`` was first seen less than CHAT_DEDUP_S ago."""
+        now = time.monotonic()
+        seen = self._chat_dedup
+        # Insertion order is age order: expire from the front.
+        while seen and (len(seen) >= CHAT_DEDUP_SLOTS or now - next(iter(seen.values())) > CHAT_DEDUP_S):
+            seen.popitem(last=False)
+        if key in seen:
+            return True
+        seen[key] = now
+        return False
+
+    def append_log(self, line: str):
+        """Queue a line for the log view; every writer (plugins included) goes through here to keep order."""
+        self._log_buffer.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start(LOG_FLUSH_MS)
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        cursor = self.log_output.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not self.log_output.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
+        self.log_output.ensureCursorVisible()
 
     @pyqtSlot()
     def scanner_finished(self):
-        self.log_output.append("**Stopped scanning/receiving**")
+        self.append_log("**Stopped scanning/receiving**")
+        self._audio_timer.stop()
+        self._audio_peak = 0.0
+        self._render_audio_level()
         self.scanner_thread = None
         self.status_label.setText("Stopped")
 
@@ -733,7 +1010,7 @@ class SDRMainWindow(QMainWindow):
         self.scan_checkbox.setChecked(False)
         self.freq_input.setValue(freq_mhz)
         if mode:
-            idx = self.mode_select.findText(mode.upper())
+            idx = _MODE_INDEX.get(mode.upper(), -1)
             if idx >= 0:
                 self.mode_select.setCurrentIndex(idx)
         if gain is not None:
@@ -749,7 +1026,7 @@ class SDRMainWindow(QMainWindow):
         self.stop_freq.setValue(stop_mhz)
         self.step_freq.setValue(step_mhz)
         if mode:
-            idx = self.mode_select.findText(mode.upper())
+            idx = _MODE_INDEX.get(mode.upper(), -1)
             if idx >= 0:
                 self.mode_select.setCurrentIndex(idx)
         if gain is not None:
@@ -767,19 +1044,27 @@ class SDRMainWindow(QMainWindow):
         return EventLogger.recent_events(n)
 
     def _agent_search(self, query: str, k: int = 5):
-        return self.transcript_index.search(query, k=k)
+        return self._cached_search(query, k)
+
+    def _cached_search(self, query: str, k: int):
+        """LRU-memoized ``transcript_index.search``; entries die with the index version."""
+        cache = self._search_cache
+        key = (query, k, self.transcript_index.version)
+        hit = cache.get(key)
+        if hit is None:
+            hit = cache[key] = self.transcript_index.search(query, k=k)
+            if len(cache) > SEARCH_CACHE_SLOTS:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        # Callers get their own dicts; the cached ones must stay untouched.
+        return [dict(r) for r in hit]
 
     @pyqtSlot()
     def open_bundles(self):
         """Open the bundles directory in the system file browser."""
-        from PyQt5.QtGui import QDesktopServices
-        from PyQt5.QtCore import QUrl
-        from pathlib import Path
-
-        # Resolve relative to repo root (astrotrace/), not the current working directory.
-        bundle_dir = (Path(__file__).resolve().parent.parent / "runs").resolve()
-        bundle_dir.mkdir(parents=True, exist_ok=True)
-        QDesktopServices.openUrl(QUrl.fromLocalFile(str(bundle_dir)))
+        self._bundle_dir.mkdir(parents=True, exist_ok=True)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(self._bundle_dir)))
 
     def _set_agent_notes(self, text: str):
         """Replace agent notes panel content."""
@@ -790,59 +1075,93 @@ class SDRMainWindow(QMainWindow):
         clean = text.strip()
         if not clean:
             return
-        self._insight_buffer.appendleft(clean)
-        self.ai_insights.setPlainText("\n• ".join([""] + list(self._insight_buffer)))
+        # Checked before the write: the panel may still show the entry being evicted.
+        multiline = any("\n" in t for t in self._insight_buffer) or "\n" in clean
+        self._insight_buffer[self._insight_idx] = clean
+        self._insight_idx = (self._insight_idx + 1) % INSIGHT_SLOTS
+        if self.ai_insights is None:
+            return
+        if multiline:
+            # Multi-line entries span several blocks; the per-block trim below would miscount.
+            self._render_insights()
+            return
+        # Prepend the new bullet after the leading blank block and drop the oldest past the cap.
+        doc = self.ai_insights.document()
+        cur = QTextCursor(doc)
+        cur.insertText(f"\n• {clean}")
+        if doc.blockCount() > INSIGHT_SLOTS + 1:
+            cur.movePosition(QTextCursor.End)
+            cur.select(QTextCursor.BlockUnderCursor)
+            cur.removeSelectedText()
+
+    def _render_insights(self):
+        if self.ai_insights is not None:
+            buf, idx = self._insight_buffer, self._insight_idx
+            newest_first = (buf[(idx - i) % INSIGHT_SLOTS] for i in range(1, INSIGHT_SLOTS + 1))
+            self.ai_insights.setPlainText("".join(f"\n• {t}" for t in newest_first if t))
 
     def _run_search(self):
         query = self.search_input.text().strip()
         if not query:
             return
-        results = self.transcript_index.search(query, k=8)
+        results = self._cached_search(query, 8)
         if not results:
-            self.search_results.setPlainText("No matches yet. (Try after you’ve captured/transcribed a few events.)")
+            self._set_search_text("No matches yet. (Try after you’ve captured/transcribed a few events.)")
             return
-        lines = []
-        for r in results:
-            ts = r.get("time", "")
-            freq_mhz = (r.get("freq", 0.0) or 0.0) / 1e6
-            text = r.get("text", "")
-            if ts:
-                lines.append(f"{ts} — {freq_mhz:.3f} MHz — {text}")
-            else:
-                lines.append(f"{freq_mhz:.3f} MHz — {text}")
-        self.search_results.setPlainText("\n".join(lines))
+        text = "\n".join(
+            f"{r['time']} — {(r.get('freq', 0.0) or 0.0) / 1e6:.3f} MHz — {r.get('text', '')}"
+            if r.get("time")
+            else f"{(r.get('freq', 0.0) or 0.0) / 1e6:.3f} MHz — {r.get('text', '')}"
+            for r in results
+        )
+        self._set_search_text(text)
+
+    def _set_search_text(self, text: str):
+        if text != self._search_text:
+            self.search_results.setPlainText(text)
+            self._search_text = text
 
     def _refresh_log_view(self):
-        events = EventLogger.recent_events(50)
-        lines = []
-        for e in events:
-            ts = e.get("time", "")
-            freq_mhz = (e.get("freq", 0.0) or 0.0) / 1e6
-            text = e.get("text", "")
-            lines.append(f"{ts} - {freq_mhz:.3f} MHz: {text}")
-        self.log_output.setPlainText("\n".join(lines))
-        self._update_log_count(len(events))
+        rows = tuple(map(_EVENT_ROW, EventLogger.recent_events(50)))
+        key = hash(rows)
+        doc = self.log_output.document()
+        # Skip the re-layout if neither the events nor the view changed since last refresh.
+        if (key, doc.revision()) != self._log_view_state:
+            self.log_output.setPlainText(
+                "\n".join(f"{ts} - {(fz or 0.0) / 1e6:.3f} MHz: {tx}" for ts, fz, tx in rows)
+            )
+            self._log_view_state = (key, doc.revision())
+        self._update_log_count(EventLogger.event_count())
 
     def _update_log_count(self, count: int):
+        # count is always EventLogger.event_count(): every logger in the process, one source.
         self.log_count_label.setText(f"{count} events")
 
     def _update_audio_level(self, rms: float):
-        try:
-            db = 20.0 * math.log10(max(rms, 1e-6))
-        except Exception:
-            db = -80.0
-        db = max(-80.0, min(0.0, db))
+        self._audio_peak = max(self._audio_peak, rms)
+
+    def _render_audio_level(self):
+        rms = self._audio_peak
+        self._audio_peak = rms * 0.6
+        db = 20.0 * math.log10(rms if rms > 1e-6 else 1e-6)
+        db = -80.0 if db < -80.0 else (0.0 if db > 0.0 else db)
         pct = int((db + 80.0) / 80.0 * 100.0)
+        if pct == self._audio_pct:
+            return
+        self._audio_pct = pct
         self.audio_bar.setValue(pct)
         if rms <= 1e-6:
             self.audio_label.setText("Audio: idle")
         else:
             self.audio_label.setText(f"Audio: {db:.1f} dBFS")
         # Audio-reactive glow on spectrum/waterfall frames
-        hot = int(180 + (pct / 100.0) * 70)
-        color = f"rgba(255, {hot}, 79, 0.65)"
-        self.spectrum_widget.setStyleSheet(f"border: 2px solid {color}; border-radius: 8px; background-color: #0f131d;")
-        self.waterfall_widget.setStyleSheet(f"border: 2px solid {color}; border-radius: 8px; background-color: #0f131d;")
+        hot = int(180 + (pct / 100.0) * 70) & ~7
+        if hot == self._glow_hot:
+            return
+        self._glow_hot = hot
+        style = _GLOW_QSS.format(hot)
+        self.spectrum_widget.setStyleSheet(style)
+        self.waterfall_widget.setStyleSheet(style)
 
     @pyqtSlot(object)
     def _play_audio(self, audio_chunk):
@@ -861,15 +1180,22 @@ class SDRMainWindow(QMainWindow):
         sr = info.get("sample_rate")
         cf = info.get("center_freq")
         serial = info.get("serial") or info.get("hardware") or ""
-        bits = [name]
-        if serial:
-            bits.append(f"serial {serial}")
-        if sr:
-            bits.append(f"{float(sr)/1e6:.3f} MS/s")
-        if cf:
-            bits.append(f"{float(cf)/1e6:.3f} MHz")
-        self.status_label.setText(" • ".join(bits))
-        self.now_source_label.setText(f"Source: {name}")
+        key = (name, serial, sr, cf)
+        if key != self._device_key:
+            bits = [name]
+            if serial:
+                bits.append(f"serial {serial}")
+            if sr:
+                bits.append(f"{float(sr)/1e6:.3f} MS/s")
+            if cf:
+                bits.append(f"{float(cf)/1e6:.3f} MHz")
+            self._device_key = key
+            self._device_text = (" • ".join(bits), f"Source: {name}")
+        # status_label has other writers, so the text is always re-applied; QLabel
+        # ignores a setText with unchanged text (no relayout or repaint).
+        status, source = self._device_text
+        self.status_label.setText(status)
+        self.now_source_label.setText(source)
 
     def _apply_preset(self, name: str):
         if not hasattr(self, "scan_checkbox"):
@@ -877,14 +1203,19 @@ class SDRMainWindow(QMainWindow):
         if not name or name.startswith("Select") or name not in self._presets:
             return
         start, stop, step, mode = self._presets[name]
-        self.scan_checkbox.setChecked(True)
-        self.start_freq.setValue(start)
-        self.stop_freq.setValue(stop)
-        self.step_freq.setValue(step)
-        idx = self.mode_select.findText(mode.upper())
-        if idx >= 0:
-            self.mode_select.setCurrentIndex(idx)
-        self.preset_combo.setCurrentText(name)
+        # preset_combo is blocked too, so syncing its text cannot re-enter this slot.
+        with _signals_blocked(
+            self.scan_checkbox, self.start_freq, self.stop_freq, self.step_freq, self.mode_select, self.preset_combo
+        ):
+            self.scan_checkbox.setChecked(True)
+            self.start_freq.setValue(start)
+            self.stop_freq.setValue(stop)
+            self.step_freq.setValue(step)
+            idx = _MODE_INDEX.get(mode.upper(), -1)
+            if idx >= 0:
+                self.mode_select.setCurrentIndex(idx)
+            self.preset_combo.setCurrentIndex(self._preset_index[name])
+        self._invalidate_params()
 
     def _set_palette(self, name: str):
         self.waterfall_widget.set_gradient(name)
@@ -895,27 +1226,40 @@ class SDRMainWindow(QMainWindow):
 
     def _load_settings(self):
         try:
-            self.scan_checkbox.setChecked(self.settings.value("scan_mode", False, type=bool))
-            self.start_freq.setValue(float(self.settings.value("start_mhz", 100.0)))
-            self.stop_freq.setValue(float(self.settings.value("stop_mhz", 101.0)))
-            self.step_freq.setValue(float(self.settings.value("step_mhz", 0.2)))
-            self.min_event_duration.setValue(float(self.settings.value("min_event_s", 1.0)))
-            auto_start = bool(self.settings.value("auto_start", False, type=bool))
-            self.auto_start_cb.setChecked(auto_start)
-            self._auto_start_flag = auto_start
-            self.hunt_mode_cb.setChecked(bool(self.settings.value("hunt_mode", False, type=bool)))
+            saved = {key: self.settings.value(key, default, type=type(default)) for key, default in _SETTINGS_DEFAULTS.items()}
         except Exception:
             self._auto_start_flag = False
+            return
+        # Apply in bulk without firing change handlers for each restored value.
+        with _signals_blocked(
+            self.scan_checkbox,
+            self.start_freq,
+            self.stop_freq,
+            self.step_freq,
+            self.min_event_duration,
+            self.auto_start_cb,
+            self.hunt_mode_cb,
+        ):
+            self.scan_checkbox.setChecked(saved["scan_mode"])
+            self.start_freq.setValue(saved["start_mhz"])
+            self.stop_freq.setValue(saved["stop_mhz"])
+            self.step_freq.setValue(saved["step_mhz"])
+            self.min_event_duration.setValue(saved["min_event_s"])
+            self.auto_start_cb.setChecked(saved["auto_start"])
+            self.hunt_mode_cb.setChecked(saved["hunt_mode"])
+        self._invalidate_params()
+        self._auto_start_flag = saved["auto_start"]
 
     def _save_settings(self):
         try:
             self.settings.setValue("scan_mode", self.scan_checkbox.isChecked())
-            self.settings.setValue("start_mhz", float(self.start_freq.value()))
-            self.settings.setValue("stop_mhz", float(self.stop_freq.value()))
-            self.settings.setValue("step_mhz", float(self.step_freq.value()))
-            self.settings.setValue("min_event_s", float(self.min_event_duration.value()))
+            self.settings.setValue("start_mhz", self.start_freq.value())
+            self.settings.setValue("stop_mhz", self.stop_freq.value())
+            self.settings.setValue("step_mhz", self.step_freq.value())
+            self.settings.setValue("min_event_s", self.min_event_duration.value())
             self.settings.setValue("auto_start", self.auto_start_cb.isChecked())
             self.settings.setValue("hunt_mode", self.hunt_mode_cb.isChecked())
+            self.settings.sync()
         except Exception:
             pass
 
@@ -926,8 +1270,8 @@ class SDRMainWindow(QMainWindow):
             "Use synthetic source for demos; switch to RTL/Soapy for hardware.<br>"
             "Bundles save IQ + SigMF; transcripts are searchable."
         )
-        if self._logo_path and Path(self._logo_path).exists():
-            pix = QPixmap(str(self._logo_path)).scaledToWidth(240, Qt.SmoothTransformation)
+        if self._logo_path:
+            pix = _scaled_pixmap(self._logo_path, width=240)
             msg = QMessageBox(self)
             msg.setWindowTitle("About AstroTrace")
             msg.setIconPixmap(pix)
@@ -937,6 +1281,7 @@ class SDRMainWindow(QMainWindow):
             QMessageBox.information(self, "About AstroTrace", text)
 
     def _update_now_playing_freqmode(self, freq_hz: float, mode: str):
+        self._now_playing = None
         try:
             self.now_freq_label.setText(f"Freq: {freq_hz/1e6:.3f} MHz")
             self.now_mode_label.setText(f"Mode: {mode}")
@@ -944,6 +1289,10 @@ class SDRMainWindow(QMainWindow):
             pass
 
     def _update_now_playing(self, freq_mhz: float, text: str):
+        # Events repeat the same frequency/text during a dwell; skip identical updates.
+        if (freq_mhz, text) == self._now_playing:
+            return
+        self._now_playing = (freq_mhz, text)
         try:
             self.now_freq_label.setText(f"Freq: {freq_mhz:.3f} MHz")
             if text:
@@ -16,6 +16,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import pyqtSignal, Qt
 
+from ui.control_panels import MODES
 from ui.plot_widgets import SpectrumWidget
 
 
@@ -42,7 +43,7 @@ class MultiChannelTab(QWidget):
         self.freq_input.setDecimals(3)
         self.freq_input.setValue(100.000)
         self.mode_select = QComboBox()
-        self.mode_select.addItems(["FM", "AM", "SSB", "CW"])
+        self.mode_select.addItems(MODES)
         self.squelch_input = QDoubleSpinBox()
         self.squelch_input.setRange(-120.0, 0.0)
         self.squelch_input.setDecimals(1)
@@ -69,7 +70,11 @@ class MultiChannelTab(QWidget):
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(self.table.SelectRows)
         self.table.setSelectionMode(self.table.SingleSelection)
+        self.table.itemChanged.connect(self._sync_row)
         layout.addWidget(self.table, stretch=1)
+        # Source of truth for emitted configs, one entry per table row (None if a
+        # hand-edited row does not parse); the table is only a view of it.
+        self._cfgs: List[dict | None] = []
 
         # Buttons
         btn_row = QHBoxLayout()
@@ -84,40 +89,52 @@ class MultiChannelTab(QWidget):
         self._update_buttons()
 
     def _add_channel(self):
+        cfg = {
+            "freq_hz": self.freq_input.value() * 1e6,
+            "mode": self.mode_select.currentText(),
+            "squelch_db": self.squelch_input.value(),
+            "enabled": True,
+            "name": self.name_input.text().strip(),
+        }
         row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(f"{self.freq_input.value():.3f}"))
-        self.table.setItem(row, 1, QTableWidgetItem(self.mode_select.currentText()))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{self.squelch_input.value():.1f}"))
-        self.table.setItem(row, 3, QTableWidgetItem(self.name_input.text().strip()))
+        self.table.blockSignals(True)
+        try:
+            self.table.insertRow(row)
+            self.table.setItem(row, 0, QTableWidgetItem(f"{self.freq_input.value():.3f}"))
+            self.table.setItem(row, 1, QTableWidgetItem(cfg["mode"]))
+            self.table.setItem(row, 2, QTableWidgetItem(f"{cfg['squelch_db']:.1f}"))
+            self.table.setItem(row, 3, QTableWidgetItem(cfg["name"]))
+        finally:
+            self.table.blockSignals(False)
+        self._cfgs.append(cfg)
         self._emit_channels()
 
     def _remove_selected(self):
         rows = sorted({idx.row() for idx in self.table.selectedIndexes()}, reverse=True)
         for r in rows:
             self.table.removeRow(r)
+            del self._cfgs[r]
         self._emit_channels()
 
+    def _sync_row(self, item: QTableWidgetItem):
+        """Re-parse a hand-edited row into its config."""
+        r = item.row()
+        if r >= len(self._cfgs):
+            return
+        cell = self.table.item
+        try:
+            self._cfgs[r] = {
+                "freq_hz": float(cell(r, 0).text()) * 1e6,
+                "mode": cell(r, 1).text().strip(),
+                "squelch_db": float(cell(r, 2).text()),
+                "enabled": True,
+                "name": cell(r, 3).text().strip(),
+            }
+        except Exception:
+            self._cfgs[r] = None
+
     def _emit_channels(self):
-        cfgs: List[dict] = []
-        for r in range(self.table.rowCount()):
-            try:
-                freq = float(self.table.item(r, 0).text())
-                mode = self.table.item(r, 1).text().strip()
-                squelch = float(self.table.item(r, 2).text())
-                name = self.table.item(r, 3).text().strip()
-                cfgs.append(
-                    {
-                        "freq_hz": freq * 1e6,
-                        "mode": mode,
-                        "squelch_db": squelch,
-                        "enabled": True,
-                        "name": name,
-                    }
-                )
-            except Exception:
-                continue
-        self.channels_changed.emit(cfgs)
+        self.channels_changed.emit([c for c in self._cfgs if c is not None])
         self._update_buttons()
 
     def _update_buttons(self):
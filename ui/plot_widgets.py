@@ -7,6 +7,7 @@ WaterfallWidget for a rolling waterfall view.
 """
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import QTimer
 import pyqtgraph as pg
 import numpy as np
 
@@ -14,55 +15,81 @@ import numpy as np
 class SpectrumWidget(pg.PlotWidget):
     """Spectrum display with optional filled gradient and peak-hold."""
 
-    def __init__(self, parent: QWidget | None = None) -> None:
+    # dB the peak-hold trace falls per frame before new maxima are applied (0 = hold forever).
+    peak_decay_db = 0.0
+
+    def __init__(self, parent: QWidget | None = None, use_opengl: bool = False) -> None:
         super().__init__(parent=parent)
+        if use_opengl:
+            # Opt-in: a QOpenGLWidget viewport is broken on some drivers and remote displays.
+            self.useOpenGL(True)
         self.setYRange(-110, 0)  # dBFS
         self.setLabel("bottom", "Frequency", "MHz")
         self.setLabel("left", "Signal Strength", "dB")
         self.showGrid(x=True, y=True, alpha=0.2)
-        self._fill_item = None
-        self._peak_curve = None
         self._last_freq = None
         self._peak = None
+        self._baseline = None
         self.setMenuEnabled(False)
         self.setMouseEnabled(x=False, y=False)
         self.hideButtons()
         self.setClipToView(True)
         self.getPlotItem().setContentsMargins(4, 4, 4, 4)
 
+        # Items are created once; each frame only swaps their data.
+        # Scanner spectra are always finite (dB of |X|^2 + eps), so the NaN/inf scan is skipped;
+        # thin traces redrawn ~25x/s gain nothing visible from antialiasing.
+        plt = self.getPlotItem()
+        curve_opts = dict(antialias=False, skipFiniteCheck=True)
+        self._live_curve = pg.PlotCurveItem(pen=pg.mkPen((255, 235, 200, 255), width=1.5), **curve_opts)
+        self._peak_curve = pg.PlotCurveItem(pen=pg.mkPen((255, 120, 40, 180), width=1), **curve_opts)
+        self._baseline_curve = pg.PlotCurveItem(pen=None, **curve_opts)
+        # Filled gradient under trace (the fill follows the live curve's path)
+        self._fill_item = pg.FillBetweenItem(self._live_curve, self._baseline_curve, brush=pg.mkBrush(255, 191, 71, 60))
+        plt.addItem(self._fill_item)
+        plt.addItem(self._peak_curve)  # Peak hold (thin line)
+        plt.addItem(self._live_curve)
+
     def update_spectrum(self, freq_axis, power):
         """Update the spectrum display with new data."""
         freq_axis = np.asarray(freq_axis, dtype=np.float32)
         power = np.asarray(power, dtype=np.float32)
-        if self._last_freq is None or len(freq_axis) != len(self._last_freq):
+        n = len(power)
+        if self._last_freq is None or len(freq_axis) != len(self._last_freq) or self._peak.size != n:
             self._peak = power.copy()
+            self._baseline = np.full(n, -110.0, dtype=np.float32)
         else:
-            self._peak = np.maximum(self._peak, power)
+            if self.peak_decay_db:
+                self._peak -= self.peak_decay_db
+            np.maximum(self._peak, power, out=self._peak)
         self._last_freq = freq_axis
 
-        plt = self.getPlotItem()
-        plt.clear()
-
-        # Filled gradient under trace
-        fill = pg.FillBetweenItem(
-            pg.PlotCurveItem(freq_axis, power, pen=pg.mkPen((255, 191, 71, 220), width=1.2)),
-            pg.PlotCurveItem(freq_axis, np.full_like(power, -110), pen=None),
-            brush=pg.mkBrush(255, 191, 71, 60),
-        )
-        plt.addItem(fill)
-
-        # Peak hold (thin line)
-        peak_curve = pg.PlotCurveItem(freq_axis, self._peak, pen=pg.mkPen((255, 120, 40, 180), width=1))
-        plt.addItem(peak_curve)
+        stride = self._stride(n)
+        if stride > 1:
+            # Max-pool to about one point per pixel; peaks survive, vertices drop.
+            m = n // stride * stride
+            x = freq_axis[:m:stride]
+            peak = self._peak[:m].reshape(-1, stride).max(axis=1)
+            power = power[:m].reshape(-1, stride).max(axis=1)
+            base = self._baseline[: m // stride]
+        else:
+            x, peak, base = freq_axis, self._peak, self._baseline
+        self._baseline_curve.setData(x, base)
+        self._peak_curve.setData(x, peak)
+        self._live_curve.setData(x, power)
 
-        # Live trace
-        live_curve = pg.PlotCurveItem(freq_axis, power, pen=pg.mkPen((255, 235, 200, 255), width=1.5))
-        plt.addItem(live_curve)
+    def _stride(self, n: int) -> int:
+        """Bins per plotted point so ``n`` bins map to roughly the viewport width."""
+        target = max(512, self.viewport().width())
+        return n // target if n > 2 * target else 1
 
 
 class WaterfallWidget(QWidget):
     """A rolling waterfall display with richer palettes and better initial fill."""
 
+    # Lines arriving faster than this are all buffered but share one image upload.
+    REFRESH_MS = 33
+
     def __init__(self, history: int = 200, parent: QWidget | None = None) -> None:
         super().__init__(parent=parent)
         self.history = history
@@ -72,21 +99,43 @@ class WaterfallWidget(QWidget):
         self.image_view.getView().setAspectLocked(False)
         layout = QVBoxLayout(self)
         layout.addWidget(self.image_view)
+        # Rows are stored twice (r and r + history) so the visible window is
+        # always the contiguous slice [_row, _row + history) — no per-line copy.
+        # Lines are quantized once to uint8 over db_range, so the image handed to
+        # pyqtgraph is a quarter the size of float32 and levels stay fixed.
+        self.db_range = (-110.0, 0.0)
         self._buffer = None  # type: np.ndarray | None
-        self._lines_seen = 0
+        self._scratch = None  # type: np.ndarray | None
+        self._row = 0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._refresh)
 
     def add_line(self, power: np.ndarray):
         """Append one spectrum line into the waterfall."""
         power = np.asarray(power, dtype=np.float32)
-        # Seed buffer with NaNs so the view is full height immediately.
-        if self._buffer is None:
-            self._buffer = np.full((self.history, power.size), np.nan, dtype=np.float32)
-        self._buffer = np.vstack((self._buffer[1:], power[None, :]))
-        self._lines_seen += 1
-
-        # Auto-level only for initial frames to avoid a flat-color band.
-        auto_levels = self._lines_seen <= 5
-        self.image_view.setImage(self._buffer, autoLevels=auto_levels, autoRange=False)
+        h = self.history
+        # Seed buffer with the floor level so the view is full height immediately.
+        if self._buffer is None or self._buffer.shape[1] != power.size:
+            self._buffer = np.zeros((2 * h, power.size), dtype=np.uint8)
+            self._scratch = np.empty(power.size, dtype=np.float32)
+            self._row = 0
+        lo, hi = self.db_range
+        q = self._scratch
+        np.subtract(power, lo, out=q)
+        np.multiply(q, 255.0 / (hi - lo), out=q)
+        np.clip(q, 0.0, 255.0, out=q)
+        self._buffer[self._row] = q
+        self._buffer[self._row + h] = q
+        self._row = (self._row + 1) % h
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.REFRESH_MS)
+
+    def _refresh(self):
+        h = self.history
+        self.image_view.setImage(
+            self._buffer[self._row:self._row + h], autoLevels=False, levels=(0, 255), autoRange=False
+        )
 
     def set_gradient(self, name: str):
         """Change waterfall color map (e.g., 'inferno', 'viridis', 'jet', 'plasma')."""